@@ -1,24 +1,21 @@
-from collections.abc import AsyncGenerator
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import os
+import re
+from collections import deque
 from pathlib import Path
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    ContentBlock,
-    Message,
-    PermissionMode,
-    ResultMessage,
-    SystemMessage,
-    TextBlock,
-    ThinkingBlock,
-    ToolResultBlock,
-    ToolUseBlock,
-    UserMessage,
-    query,
-)
+from typing import TYPE_CHECKING, Any
 
 from src.exceptions import AgentQueryUnknownError
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Iterator
+
+    from claude_agent_sdk import ContentBlock, Message, PermissionMode
+
 
 def extract_session_id(message: Message) -> str | None:
     """
@@ -26,73 +23,216 @@ def extract_session_id(message: Message) -> str | None:
 
     Returns the session_id if the message is an init SystemMessage, None otherwise.
     """
+    from claude_agent_sdk import SystemMessage
+
     if isinstance(message, SystemMessage) and message.subtype == "init":
         session_id: str | None = message.data.get("session_id")
         return session_id
     return None
 
 
+# Max characters of staged diff inlined into a prompt; larger diffs are
+# middle-truncated so prompt token cost stays bounded.
+_STAGED_DIFF_CAP = 200_000
+_TRUNCATION_MARKER = "\n... [diff truncated: middle omitted] ...\n"
+
+
+async def _read_git_stdout(cwd: Path, *args: str) -> str:
+    """Run a single git command and return its stdout, or '' on failure."""
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return ""
+    return stdout.decode("utf-8", "replace")
+
+
+def truncate_middle(text: str, cap: int = _STAGED_DIFF_CAP) -> str:
+    """Truncate `text` to at most `cap` characters, keeping both ends."""
+    if len(text) <= cap:
+        return text
+    half = (cap - len(_TRUNCATION_MARKER)) // 2
+    return text[:half] + _TRUNCATION_MARKER + text[-half:]
+
+
+async def collect_staged_context(cwd: Path) -> tuple[str, str]:
+    """
+    Collect the staged file list and staged diff with two batched git calls.
+
+    Callers inline the result into agent prompts so agents never shell out to
+    git themselves: two forks per phase instead of one per agent tool call.
+    The diff is middle-truncated at _STAGED_DIFF_CAP characters.
+
+    Returns:
+        A tuple of (staged file names, staged diff text).
+    """
+    staged_files = await _read_git_stdout(cwd, "diff", "--cached", "--name-only")
+    staged_diff = await _read_git_stdout(cwd, "diff", "--cached")
+    return staged_files.strip(), truncate_middle(staged_diff)
+
+
+@functools.lru_cache(maxsize=8)
+def resolve_workspace_path(workspace_path: Path | None) -> Path:
+    """
+    Resolve an optional workspace path to an absolute Path, memoized.
+
+    Every phase entry point used to re-run expanduser()/Path.cwd() (a getcwd
+    syscall) on the same handful of paths; caching returns the same Path
+    object, which also keeps downstream per-path caches warm.
+    """
+    if workspace_path is not None:
+        return Path(workspace_path).expanduser().resolve()
+    return Path.cwd().resolve()
+
+
+def consume_plan_file(path: Path) -> str:
+    """
+    Read a plan file and delete it through a single file descriptor.
+
+    Unlinking first (the fd keeps the inode alive on POSIX) closes the window
+    where an agent could `git add` the plan between read and delete, and the
+    whole operation resolves the path once instead of twice.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.unlink(path)
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def _format_bash_tool(tool_input: dict[str, Any]) -> str:
+    command = tool_input.get("command", "unknown")
+    description = tool_input.get("description")
+    if description:
+        return f"💻 Bash: {description}\n   ↳ {command}"
+    return f"💻 Bash: {command}"
+
+
+# (input key, display template) per single-argument tool, precomputed at import.
+# %-style templates: single-substitution %-formatting is cheaper than
+# str.format/f-strings in CPython. Bash is handled separately since it
+# formats two input keys.
+_TOOL_TABLE: dict[str, tuple[str, str]] = {
+    "Read": ("file_path", "📖 Reading: %s"),
+    "Write": ("file_path", "✏️  Writing: %s"),
+    "Edit": ("file_path", "🔧 Editing: %s"),
+    "Glob": ("pattern", "🔍 Searching files: %s"),
+    "Grep": ("pattern", "🔍 Searching content: %s"),
+}
+
+
+# Matches the first non-whitespace character; used as a non-empty test that,
+# unlike .strip(), doesn't copy the (potentially large) block text.
+_NON_WS = re.compile(r"\S")
+
+
+def _handle_text_block(block: Any, output_parts: list[str]) -> None:
+    # Show LLM text responses
+    if _NON_WS.search(block.text):
+        output_parts.append(block.text)
+
+
+def _handle_thinking_block(block: Any, output_parts: list[str]) -> None:
+    # Show LLM thinking/reasoning
+    if _NON_WS.search(block.thinking):
+        output_parts.append(f"💭 {block.thinking}")
+
+
+def _handle_tool_use_block(block: Any, output_parts: list[str]) -> None:
+    # Show tool usage in a friendly way
+    tool_name = block.name
+    entry = _TOOL_TABLE.get(tool_name)
+    if entry is not None:
+        key, template = entry
+        output_parts.append(template % block.input.get(key, "unknown"))
+    elif tool_name == "Bash":
+        output_parts.append(_format_bash_tool(block.input))
+    else:
+        output_parts.append(f"🔧 Using tool: {tool_name}")
+
+
+def _handle_tool_result_block(block: Any, output_parts: list[str]) -> None:
+    if block.is_error:
+        output_parts.append("Error calling tool.")
+    else:
+        output_parts.append("Tool call succeeded.")
+    output_parts.append(block.content)
+
+
+@functools.lru_cache(maxsize=1)
+def _block_handlers() -> dict[type, Callable[[Any, list[str]], None]]:
+    """Map each content block type to its handler (built once, after the lazy SDK import)."""
+    from claude_agent_sdk import TextBlock, ThinkingBlock, ToolResultBlock, ToolUseBlock
+
+    return {
+        TextBlock: _handle_text_block,
+        ThinkingBlock: _handle_thinking_block,
+        ToolUseBlock: _handle_tool_use_block,
+        ToolResultBlock: _handle_tool_result_block,
+    }
+
+
 def _format_content_blocks(content: list[ContentBlock]) -> list[str]:
-    output_parts = []
+    output_parts: list[str] = []
+    handlers = _block_handlers()
 
     for block in content:
-        if isinstance(block, TextBlock):
-            # Show LLM text responses
-            if block.text.strip():
-                output_parts.append(block.text)
-
-        elif isinstance(block, ThinkingBlock):
-            # Show LLM thinking/reasoning
-            if block.thinking.strip():
-                output_parts.append(f"💭 {block.thinking}")
-
-        elif isinstance(block, ToolUseBlock):
-            # Show tool usage in a friendly way
-            tool_name = block.name
-            tool_input = block.input
-
-            if tool_name == "Read":
-                file_path = tool_input.get("file_path", "unknown")
-                output_parts.append(f"📖 Reading: {file_path}")
-
-            elif tool_name == "Write":
-                file_path = tool_input.get("file_path", "unknown")
-                output_parts.append(f"✏️  Writing: {file_path}")
-
-            elif tool_name == "Edit":
-                file_path = tool_input.get("file_path", "unknown")
-                output_parts.append(f"🔧 Editing: {file_path}")
-
-            elif tool_name == "Glob":
-                pattern = tool_input.get("pattern", "unknown")
-                output_parts.append(f"🔍 Searching files: {pattern}")
-
-            elif tool_name == "Grep":
-                pattern = tool_input.get("pattern", "unknown")
-                output_parts.append(f"🔍 Searching content: {pattern}")
-
-            elif tool_name == "Bash":
-                command = tool_input.get("command", "unknown")
-                description = tool_input.get("description")
-                if description:
-                    output_parts.append(f"💻 Bash: {description}")
-                    output_parts.append(f"   ↳ {command}")
-                else:
-                    output_parts.append(f"💻 Bash: {command}")
-
-            else:
-                output_parts.append(f"🔧 Using tool: {tool_name}")
-
-        elif isinstance(block, ToolResultBlock):
-            if block.is_error:
-                output_parts.append("Error calling tool.")
-            else:
-                output_parts.append("Tool call succeeded.")
-            output_parts.append(block.content)
+        handler = handlers.get(type(block))
+        if handler is not None:
+            handler(block, output_parts)
 
     return output_parts
 
 
+@functools.singledispatch
+def _format_message(_message: object) -> str | None:
+    # Unknown message types (and skipped ones without a registered handler)
+    # produce no output.
+    return None
+
+
+def _format_assistant_message(message: Any) -> str | None:
+    # Process content blocks from the assistant
+    if not message.content:
+        return None
+    output_parts = _format_content_blocks(message.content)
+    if output_parts:
+        return "\n".join(output_parts)
+    return None
+
+
+def _format_result_message(message: Any) -> str | None:
+    # Show completion summary with cost if available
+    parts = [f"✅ Completed in {message.duration_ms / 1000:.1f}s"]
+    if message.total_cost_usd is not None:
+        parts.append(f"(${message.total_cost_usd:.4f})")
+    return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _register_message_handlers() -> None:
+    """Register singledispatch handlers on first use, after the lazy SDK import."""
+    from claude_agent_sdk import AssistantMessage, ResultMessage, SystemMessage, UserMessage
+
+    _format_message.register(AssistantMessage, _format_assistant_message)
+    _format_message.register(ResultMessage, _format_result_message)
+    # UserMessage: skip (user's own input); SystemMessage: skip (internal metadata)
+    _format_message.register(UserMessage, lambda _message: None)
+    _format_message.register(SystemMessage, lambda _message: None)
+
+
 def format_message_for_display(message: Message) -> str | None:
     """
     Format a Message object for user-friendly display.
@@ -106,38 +246,238 @@ def format_message_for_display(message: Message) -> str | None:
     - ResultMessage: Show completion summary
     - StreamEvent: Handle partial streaming updates
     """
-    if isinstance(message, UserMessage):
-        # Skip user messages - they already know what they sent
-        return None
+    _register_message_handlers()
+    return _format_message(message)
 
-    elif isinstance(message, AssistantMessage):
-        # Process content blocks from the assistant
-        output_parts = _format_content_blocks(message.content)
-        if output_parts:
-            return "\n".join(output_parts)
-        return None
 
-    elif isinstance(message, SystemMessage):
-        # Skip system messages (init, etc.) - internal metadata
-        return None
+def iter_display_and_text(message: Message) -> Iterator[tuple[str | None, str | None]]:
+    """
+    Walk a message's content once, yielding (display_line, text_chunk) pairs.
 
-    elif isinstance(message, ResultMessage):
-        # Show completion summary with cost if available
-        parts = [f"✅ Completed in {message.duration_ms / 1000:.1f}s"]
-        if message.total_cost_usd is not None:
-            parts.append(f"(${message.total_cost_usd:.4f})")
-        return " ".join(parts)
+    For assistant messages each content block yields its formatted display line
+    (or None) together with its raw text when the block is a TextBlock. Other
+    message types yield a single (formatted_message, None) pair. Callers that
+    need both the printable output and the accumulated text (e.g. the commit
+    message generator) can consume this instead of iterating the content twice.
+    """
+    from claude_agent_sdk import AssistantMessage, TextBlock
 
-    return None
+    if isinstance(message, AssistantMessage):
+        handlers = _block_handlers()
+        for block in message.content:
+            parts: list[str] = []
+            handler = handlers.get(type(block))
+            if handler is not None:
+                handler(block, parts)
+            text = block.text if type(block) is TextBlock else None
+            yield ("\n".join(parts) if parts else None, text)
+    else:
+        yield (format_message_for_display(message), None)
+
+
+# When set, only completion summaries are printed; intermediate agent messages
+# are skipped without even being formatted. Computed once at import.
+_QUIET = bool(os.environ.get("TICKET2PR_QUIET"))
 
 
 def print_agent_message(message: Message) -> None:
     """Print a message in a user-friendly format."""
+    if _QUIET:
+        from claude_agent_sdk import ResultMessage
+
+        if not isinstance(message, ResultMessage):
+            return
     formatted = format_message_for_display(message)
     if formatted:
         print(formatted)
 
 
+class DedupPrinter:
+    """
+    Printer that drops recently repeated messages.
+
+    Long agent runs emit empty keepalives and duplicate tool_result echoes;
+    each would otherwise be formatted and written to stdout (which takes the
+    GIL and the stdout lock). A small ring of recent message hashes filters
+    the repeats while genuinely alternating messages still print.
+    """
+
+    def __init__(
+        self,
+        printer: Callable[[Message], None] = print_agent_message,
+        history: int = 8,
+    ) -> None:
+        self._printer = printer
+        self._recent: deque[int] = deque(maxlen=history)
+
+    def __call__(self, message: Message) -> None:
+        digest = hash(repr(message))
+        if digest in self._recent:
+            return
+        self._recent.append(digest)
+        self._printer(message)
+
+
+class PlanWriteWatcher:
+    """
+    Printer wrapper that flags when the agent's Write tool targets a file.
+
+    Watching the tool-use stream gives an event-driven signal that the plan
+    was written, so callers don't have to rely solely on a post-hoc stat of
+    the plan path (non-trivial on networked filesystems, and racy if the
+    agent renames). Callers should still keep `exists()` as a fallback.
+    """
+
+    def __init__(
+        self, watched_path: Path, printer: Callable[[Message], None] = print_agent_message
+    ) -> None:
+        self._watched_path = watched_path.resolve()
+        self._printer = printer
+        self.wrote_file = False
+
+    def __call__(self, message: Message) -> None:
+        if not self.wrote_file:
+            self._inspect(message)
+        self._printer(message)
+
+    def _inspect(self, message: Message) -> None:
+        from claude_agent_sdk import AssistantMessage, ToolUseBlock
+
+        if not isinstance(message, AssistantMessage):
+            return
+        for block in message.content:
+            if isinstance(block, ToolUseBlock) and block.name == "Write":
+                raw_path = block.input.get("file_path")
+                if not raw_path:
+                    continue
+                candidate = Path(raw_path)
+                if not candidate.is_absolute():
+                    candidate = self._watched_path.parent / candidate
+                if candidate.resolve() == self._watched_path:
+                    self.wrote_file = True
+                    return
+
+
+class MutationWatcher:
+    """
+    Printer wrapper that flags when the agent appears to modify the worktree.
+
+    A Write or Edit tool use is a direct file change; a Bash `git add` is the
+    staging step the fixer agents are instructed to run after changing files.
+    Callers use the flag to skip re-verification when an agent run made no
+    changes at all.
+    """
+
+    def __init__(self, printer: Callable[[Message], None] = print_agent_message) -> None:
+        self._printer = printer
+        self.changes_made = False
+
+    def __call__(self, message: Message) -> None:
+        if not self.changes_made:
+            self._inspect(message)
+        self._printer(message)
+
+    def _inspect(self, message: Message) -> None:
+        from claude_agent_sdk import AssistantMessage, ToolUseBlock
+
+        if not isinstance(message, AssistantMessage):
+            return
+        for block in message.content:
+            if not isinstance(block, ToolUseBlock):
+                continue
+            if block.name in ("Write", "Edit"):
+                self.changes_made = True
+                return
+            if block.name == "Bash" and "git add" in str(block.input.get("command", "")):
+                self.changes_made = True
+                return
+
+
+async def drain_agent_messages(
+    messages: AsyncGenerator[Message],
+    printer: Callable[[Message], None] | None = None,
+) -> None:
+    """
+    Consume an agent message stream, printing through a bounded queue.
+
+    print blocks on the stdout lock; on slow sinks (CI log pipes, Docker TTYs)
+    that back-pressures the LLM stream consumer and idles the network socket.
+    A producer task keeps reading the stream while a consumer task prints each
+    message in a worker thread; the bounded queue caps buffered messages.
+
+    When no printer is given, a fresh DedupPrinter is used so repeated
+    keepalive/echo messages are dropped per drain.
+    """
+    if printer is None:
+        printer = DedupPrinter()
+    queue: asyncio.Queue[Message | None] = asyncio.Queue(maxsize=64)
+
+    async def _produce() -> None:
+        try:
+            async for message in messages:
+                await queue.put(message)
+        finally:
+            await queue.put(None)
+
+    async def _consume() -> None:
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+            await asyncio.to_thread(printer, message)
+
+    await asyncio.gather(_produce(), _consume())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_mcp_config(path: str) -> dict[str, Any]:
+    """
+    Parse an mcp.json file once per session and return the server mapping.
+
+    Retry loops and multi-phase agents pass the same config path on every
+    query; caching the parsed dict means the SDK receives a ready mapping
+    instead of re-reading and re-parsing the file each time. Supports both
+    a bare server mapping and the conventional {"mcpServers": {...}} wrapper.
+    """
+    with open(path, "rb") as config_file:
+        data = json.load(config_file)
+    servers: dict[str, Any] = data.get("mcpServers", data)
+    return servers
+
+
+@functools.lru_cache(maxsize=16)
+def _build_options(
+    allowed_tools: tuple[str, ...],
+    system_prompt: str,
+    permission_mode: str,
+    cwd: str | None,
+    mcp_config_path: str | None,
+    resume: str | None,
+    max_turns: int | None,
+) -> Any:
+    """Build (and cache) agent options; retry loops re-request identical options."""
+    from claude_agent_sdk import ClaudeAgentOptions
+
+    return ClaudeAgentOptions(
+        **{
+            key: value
+            for key, value in (
+                ("allowed_tools", list(allowed_tools)),
+                ("system_prompt", system_prompt),
+                ("permission_mode", permission_mode),
+                ("cwd", cwd),
+                (
+                    "mcp_servers",
+                    _load_mcp_config(mcp_config_path) if mcp_config_path is not None else None,
+                ),
+                ("resume", resume),
+                ("max_turns", max_turns),
+            )
+            if value is not None
+        }
+    )
+
+
 async def run_agent_query(
     prompt: str,
     system_prompt: str,
@@ -146,6 +486,7 @@ async def run_agent_query(
     cwd: Path | None = None,
     mcp_config_path: Path | None = None,
     session_id: str | None = None,
+    max_turns: int | None = None,
 ) -> AsyncGenerator[Message]:
     """
     Execute a Claude Agent SDK query with standardized message handling.
@@ -161,22 +502,20 @@ async def run_agent_query(
                         to allow full access without prompts.
         cwd: Optional current working directory for the agent to run from.
         mcp_config_path: Optional path to mcp.json configuration file for MCP servers.
+        max_turns: Optional hard cap on agent turns; the SDK stops the run
+                   once reached, bounding a looping agent's token spend.
     """
-    options_kwargs = {
-        "allowed_tools": allowed_tools,
-        "system_prompt": system_prompt,
-        "permission_mode": permission_mode,
-    }
-
-    if cwd is not None:
-        options_kwargs["cwd"] = str(cwd)
-
-    if mcp_config_path is not None:
-        options_kwargs["mcp_servers"] = mcp_config_path
-
-    if session_id is not None:
-        options_kwargs["resume"] = session_id
-    options = ClaudeAgentOptions(**options_kwargs)
+    from claude_agent_sdk import query
+
+    options = _build_options(
+        tuple(allowed_tools),
+        system_prompt,
+        permission_mode,
+        str(cwd) if cwd is not None else None,
+        str(mcp_config_path) if mcp_config_path is not None else None,
+        session_id,
+        max_turns,
+    )
     try:
         async for message in query(prompt=prompt, options=options):
             yield message
@@ -1,8 +1,6 @@
 from pathlib import Path
 
-from claude_agent_sdk import TextBlock
-
-from src.agents.base import print_agent_message, run_agent_query
+from src.agents.base import iter_display_and_text, run_agent_query
 
 SYSTEM_PROMPT = """
 You are an expert Software Engineer. You write clear, concise, and helpful git commit messages.
@@ -45,7 +43,7 @@ text, nothing else. No explanations, no markdown, no code blocks, no headers.
 
 
 async def generate_ai_commit_message(workspace_path: Path) -> str:
-    full_message = ""
+    parts: list[str] = []
     async for message in run_agent_query(
         prompt=PROMPT,
         system_prompt=SYSTEM_PROMPT,
@@ -56,11 +54,11 @@ async def generate_ai_commit_message(workspace_path: Path) -> str:
         if isinstance(message, str):
             continue
 
-        print_agent_message(message)
-
-        if hasattr(message, "content"):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    full_message += block.text
+        # Single pass over the content: print display lines and collect text
+        for display, text in iter_display_and_text(message):
+            if display:
+                print(display)
+            if text is not None:
+                parts.append(text)
 
-    return full_message
+    return "".join(parts)
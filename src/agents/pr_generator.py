@@ -1,8 +1,6 @@
 from pathlib import Path
 
-from claude_agent_sdk import TextBlock
-
-from src.agents.base import print_agent_message, run_agent_query
+from src.agents.base import iter_display_and_text, run_agent_query
 
 SYSTEM_PROMPT = """
 You are an expert Software Engineer who writes clear, concise commit messages and PR bodies.
@@ -114,7 +112,7 @@ async def generate_commit_and_pr_body(
     Returns:
         A tuple of (commit_message, pr_body)
     """
-    full_response = ""
+    response_parts: list[str] = []
     async for message in run_agent_query(
         prompt=PROMPT,
         system_prompt=SYSTEM_PROMPT,
@@ -123,11 +121,13 @@ async def generate_commit_and_pr_body(
         mcp_config_path=mcp_config_path,
         session_id=session_id,
     ):
-        print_agent_message(message)
-        if hasattr(message, "content"):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    full_response += block.text
+        # Single pass over the content: print display lines and collect text
+        for display, text in iter_display_and_text(message):
+            if display:
+                print(display)
+            if text is not None:
+                response_parts.append(text)
+    full_response = "".join(response_parts)
 
     # Parse the response to extract commit message and PR body
     commit_message = ""
@@ -1,6 +1,12 @@
+import functools
 from pathlib import Path
 
-from src.agents.base import print_agent_message, run_agent_query
+from src.agents.base import (
+    DedupPrinter,
+    MutationWatcher,
+    drain_agent_messages,
+    run_agent_query,
+)
 
 SYSTEM_PROMPT = """
 You are an expert Software Engineer specializing in fixing pre-commit hook failures.
@@ -46,12 +52,18 @@ Pre-commit output:
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _format_system_prompt(max_retries: int) -> str:
+    """Format the multi-kilobyte system prompt once per distinct max_retries value."""
+    return SYSTEM_PROMPT.format(max_retries=max_retries)
+
+
 async def try_fix_pre_commit(
     workspace_path: Path,
     pre_commit_output: str,
     max_retries: int = 5,
     mcp_config_path: Path | None = None,
-) -> None:
+) -> bool:
     """
     Attempt to fix pre-commit hook failures using AI.
 
@@ -63,18 +75,26 @@ async def try_fix_pre_commit(
         pre_commit_output: The output from a failed pre-commit run
         max_retries: Maximum number of retry attempts for the AI (default: 5)
         mcp_config_path: Optional path to MCP config file
+
+    Returns:
+        True if the agent made changes (wrote/edited files or staged fixes),
+        False if it left the worktree untouched
     """
-    system_prompt = SYSTEM_PROMPT.format(max_retries=max_retries)
+    system_prompt = _format_system_prompt(max_retries)
     prompt = PROMPT_TEMPLATE.format(
         pre_commit_output=pre_commit_output,
     )
 
-    async for message in run_agent_query(
-        prompt=prompt,
-        system_prompt=system_prompt,
-        allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
-        permission_mode="acceptEdits",
-        cwd=workspace_path,
-        mcp_config_path=mcp_config_path,
-    ):
-        print_agent_message(message)
+    watcher = MutationWatcher(printer=DedupPrinter())
+    await drain_agent_messages(
+        run_agent_query(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
+            permission_mode="acceptEdits",
+            cwd=workspace_path,
+            mcp_config_path=mcp_config_path,
+        ),
+        printer=watcher,
+    )
+    return watcher.changes_made
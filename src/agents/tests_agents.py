@@ -1,12 +1,123 @@
+import asyncio
+import fnmatch
+import hashlib
 import logging
+import os
+import re
+import shutil
 from pathlib import Path
 
-from src.agents.base import print_agent_message, run_agent_query
+from src.agents.base import (
+    DedupPrinter,
+    PlanWriteWatcher,
+    collect_staged_context,
+    consume_plan_file,
+    drain_agent_messages,
+    resolve_workspace_path,
+    run_agent_query,
+)
 
 logger = logging.getLogger(__name__)
 
 TESTS_PLAN_FILENAME = "TESTS_PLAN.md"
 
+PLAN_CACHE_DIRNAME = ".ticket2pr_cache"
+_PLAN_CACHE_MAX_ENTRIES = 32
+
+# File types that can have tests; staged sets touching none of these skip the
+# test pipeline (and its planner agent run) entirely.
+CODE_EXTENSIONS = {".py", ".ts", ".js", ".go", ".rs", ".java", ".rb", ".cpp", ".c", ".h"}
+SKIP_PATTERNS = ["*.md", "*.txt", "docs/**", "*.lock", "*.yml", "*.yaml", "*.toml"]
+
+
+async def _staged_file_names(cwd: Path) -> list[str]:
+    """List staged file names with one NUL-delimited `git diff --cached --name-only -z`."""
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        "diff",
+        "--cached",
+        "--name-only",
+        "-z",
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return []
+    return [name for name in stdout.decode("utf-8", "replace").split("\x00") if name]
+
+
+def _is_code_file(path: str, code_extensions: set[str], skip_patterns: list[str]) -> bool:
+    if os.path.splitext(path)[1] not in code_extensions:
+        return False
+    return not any(fnmatch.fnmatch(path, pattern) for pattern in skip_patterns)
+
+
+def _staged_diff_hash(staged_diff: str) -> str | None:
+    """
+    Hash the staged diff text for cache keying.
+
+    Returns a short sha256 hex digest, or None when nothing is staged (in
+    which case caching is pointless).
+    """
+    if not staged_diff:
+        return None
+    return hashlib.sha256(staged_diff.encode("utf-8")).hexdigest()[:16]
+
+
+def _plan_cache_path(cache_dir: Path, diff_hash: str) -> Path:
+    return cache_dir / f"plan-{diff_hash}.md"
+
+
+async def _exclude_cache_dir_from_git(cwd: Path) -> None:
+    """Register the plan cache dirname in the repo's `.git/info/exclude`.
+
+    The cache lives inside the workspace the fixer and solver agents run
+    `git add` in; an exclude entry makes it invisible to git without
+    touching the project's own .gitignore. `--git-common-dir` resolves the
+    shared git directory even from a linked worktree.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        "rev-parse",
+        "--git-common-dir",
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return
+    git_dir = Path(stdout.decode("utf-8", "replace").strip())
+    if not git_dir.is_absolute():
+        git_dir = cwd / git_dir
+    exclude_path = git_dir / "info" / "exclude"
+    pattern = f"/{PLAN_CACHE_DIRNAME}/"
+    try:
+        existing = exclude_path.read_text(encoding="utf-8") if exclude_path.is_file() else ""
+        if pattern in existing.splitlines():
+            return
+        exclude_path.parent.mkdir(parents=True, exist_ok=True)
+        with exclude_path.open("a", encoding="utf-8") as exclude_file:
+            if existing and not existing.endswith("\n"):
+                exclude_file.write("\n")
+            exclude_file.write(pattern + "\n")
+    except OSError:
+        logger.debug("Could not register %s in git exclude", PLAN_CACHE_DIRNAME, exc_info=True)
+
+
+def _evict_old_plans(cache_dir: Path) -> None:
+    """Keep only the newest _PLAN_CACHE_MAX_ENTRIES cached plans (by mtime)."""
+    try:
+        cached_plans = sorted(
+            cache_dir.glob("plan-*.md"), key=os.path.getmtime, reverse=True
+        )
+    except OSError:
+        return
+    for stale_plan in cached_plans[_PLAN_CACHE_MAX_ENTRIES:]:
+        stale_plan.unlink(missing_ok=True)
+
 
 TESTS_PLANNER_SYSTEM_PROMPT = """
 You are an expert Software Engineer in the TEST PLANNING phase.
@@ -16,8 +127,8 @@ any new tests. If there are no existing tests that clearly relate to the staged
 changes, do NOT write {plan_filename}—exit without creating any file.
 
 Workflow:
-1. Run `git diff --cached --name-only` (and optionally `git diff --cached`) to
-   see staged changes.
+1. The staged changes (file list and diff) are provided inline in the prompt —
+   do NOT re-run `git diff`.
 2. Find EXISTING tests related to those files (test dirs, naming, imports; use
    Grep/Glob as needed). Only list tests that already exist in the repo.
 3. If you find no relevant existing tests for the staged changes, do nothing
@@ -37,7 +148,13 @@ fix tests from it):
 """
 
 TESTS_PLANNER_PROMPT_TEMPLATE = """
-Analyze the staged git changes and produce a test plan in {plan_filename}.
+Analyze the staged git changes below and produce a test plan in {plan_filename}.
+
+Staged files:
+{staged_files}
+
+Staged diff:
+{staged_diff}
 """
 
 
@@ -45,6 +162,8 @@ async def plan_tests(
     workspace_path: Path | None = None,
     mcp_config_path: Path | None = None,
     plan_filename: str = TESTS_PLAN_FILENAME,
+    plan_cache_dir: Path | None = None,
+    force_refresh: bool = False,
 ) -> Path | None:
     """
     Analyze staged changes and create a test plan (related existing tests + how to run them).
@@ -52,32 +171,63 @@ async def plan_tests(
     Only creates a plan if there are existing tests related to the staged changes.
     Never suggests or creates new tests.
 
+    Plans are cached on disk keyed by the hash of the staged diff, so rerunning
+    on identical staged changes (common in tight edit-commit loops) skips the
+    planner agent entirely.
+
     Args:
         workspace_path: Path to the workspace root. Defaults to current directory.
         mcp_config_path: Optional path to MCP config file.
         plan_filename: Name of the plan file to write. Defaults to TESTS_PLAN.md.
+        plan_cache_dir: Directory for cached plans. Defaults to
+            `.ticket2pr_cache` inside the workspace.
+        force_refresh: When True, bypass the cache and always run the planner.
 
     Returns:
         Path to the created plan file, or None if no relevant existing tests were found
         (plan file is not written in that case).
     """
-    cwd = Path(workspace_path).expanduser() if workspace_path else Path.cwd()
+    cwd = resolve_workspace_path(workspace_path)
     plan_path = cwd / plan_filename
+    cache_dir = plan_cache_dir if plan_cache_dir is not None else cwd / PLAN_CACHE_DIRNAME
+
+    staged_files, staged_diff = await collect_staged_context(cwd)
+    diff_hash = _staged_diff_hash(staged_diff)
+    cached_plan = _plan_cache_path(cache_dir, diff_hash) if diff_hash else None
+    if cached_plan is not None and not force_refresh and cached_plan.is_file():
+        logger.info("Reusing cached test plan for staged diff %s", diff_hash)
+        shutil.copyfile(cached_plan, plan_path)
+        return plan_path
 
     system_prompt = TESTS_PLANNER_SYSTEM_PROMPT.format(plan_filename=plan_filename)
-    prompt = TESTS_PLANNER_PROMPT_TEMPLATE.format(plan_filename=plan_filename)
+    prompt = TESTS_PLANNER_PROMPT_TEMPLATE.format(
+        plan_filename=plan_filename,
+        staged_files=staged_files or "(none)",
+        staged_diff=staged_diff or "(empty)",
+    )
 
-    async for message in run_agent_query(
-        prompt=prompt,
-        system_prompt=system_prompt,
-        allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
-        cwd=cwd,
-        mcp_config_path=mcp_config_path,
-    ):
-        print_agent_message(message)
+    watcher = PlanWriteWatcher(plan_path, printer=DedupPrinter())
+    await drain_agent_messages(
+        run_agent_query(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
+            cwd=cwd,
+            mcp_config_path=mcp_config_path,
+        ),
+        printer=watcher,
+    )
 
-    if not plan_path.exists():
+    if not watcher.wrote_file and not plan_path.exists():
         return None
+    if cached_plan is not None:
+        cache_dir.mkdir(exist_ok=True)
+        if plan_cache_dir is None:
+            # The default cache dir sits inside the workspace; keep it out
+            # of anything the agents might stage.
+            await _exclude_cache_dir_from_git(cwd)
+        shutil.copyfile(plan_path, cached_plan)
+        _evict_old_plans(cache_dir)
     return plan_path
 
 
@@ -93,8 +243,8 @@ Workflow:
    Only if the run fails due to env/setup (e.g. missing deps), run the plan
    setup then retry.
 2. If tests fail for other reasons, analyze and fix ONLY existing code or
-   existing tests as appropriate. Repeat until all planned tests pass (up to
-   {max_retries} attempts). Never add new test cases or new test files.
+   existing tests as appropriate, then re-run the plan test command(s) to
+   verify. Never add new test cases or new test files.
 3. When all pass, run `git add` only for files you modified. Do not stage
    {plan_filename}, unrelated files, or the whole repo. Delete any temporary
    helper files and do not add them to git.
@@ -102,16 +252,72 @@ Workflow:
 Behavior:
 - Fix only what is needed to make existing tests pass; correct existing tests
   when they are wrong, implementation when it is wrong. Do not create new tests.
+- If the planned tests already pass, make no changes at all.
 - Use Read, Write, Grep, Glob, and Bash as needed.
 """
 
 TESTS_FIXER_PROMPT_TEMPLATE = """
-Run and fix tests according to the plan below until they pass, then stage only
-your changes.
+Run and fix tests according to the plan below (attempt {attempt}/{max_retries}),
+then stage only your changes. If everything already passes, change nothing.
+
+Setup command (run only if the test run fails due to environment/setup):
+{setup_cmd}
+
+Test command (use verbatim; do not re-derive it from the plan):
+{test_cmd}
 
 {plan_content}
 """
 
+# Fenced code block under a "## Setup" / "## Run commands" heading of the plan
+# markdown; extracted once in Python so the fixer agent doesn't re-parse the
+# plan's prose on every retry.
+_SETUP_BLOCK_RE = re.compile(r"##+\s*Setup\s*\n+```(?:bash|sh)?\n(.*?)\n```", re.S | re.I)
+_RUN_COMMANDS_BLOCK_RE = re.compile(
+    r"##+\s*Run commands\s*\n+```(?:bash|sh)?\n(.*?)\n```", re.S | re.I
+)
+
+
+def _extract_plan_commands(plan_content: str) -> tuple[str, str]:
+    """Pull the (setup_cmd, test_cmd) blocks out of the plan markdown ('' if absent)."""
+    setup_match = _SETUP_BLOCK_RE.search(plan_content)
+    run_match = _RUN_COMMANDS_BLOCK_RE.search(plan_content)
+    setup_cmd = setup_match.group(1).strip() if setup_match else ""
+    test_cmd = run_match.group(1).strip() if run_match else ""
+    return setup_cmd, test_cmd
+
+
+async def _run_test_command(test_cmd: str, cwd: Path) -> int | None:
+    """Run the plan's test command; return its exit code (None on spawn failure)."""
+    try:
+        process = await asyncio.create_subprocess_shell(  # nosec B602: command comes
+            # from the plan our own planner agent wrote; the fixer agent runs
+            # arbitrary shell in this workspace anyway.
+            test_cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    return await process.wait()
+
+
+async def _working_tree_hash(cwd: Path) -> str | None:
+    """Hash `git diff HEAD` (staged + unstaged) for fixed-point detection."""
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        "diff",
+        "HEAD",
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return None
+    return hashlib.sha256(stdout).hexdigest()
+
 
 async def fix_tests(
     plan_content: str,
@@ -124,6 +330,11 @@ async def fix_tests(
     Run tests from the plan and fix failures until passing; then stage only the
     fixer's changes.
 
+    The retry loop lives here rather than inside a single agent run: each
+    attempt is one bounded agent query, and the loop stops early when the
+    working tree reaches a fixed point (an attempt changes nothing), so a
+    stuck agent can't burn all max_retries runs making no progress.
+
     Args:
         plan_content: Contents of the test plan (e.g. from plan_tests output).
         plan_filename: Name of the plan file (for "do not stage" instruction).
@@ -131,43 +342,82 @@ async def fix_tests(
         mcp_config_path: Optional path to MCP config file.
         max_retries: Maximum number of fix-and-rerun cycles. Default 10.
     """
-    cwd = Path(workspace_path).expanduser() if workspace_path else Path.cwd()
-
-    system_prompt = TESTS_FIXER_SYSTEM_PROMPT.format(
-        max_retries=max_retries,
-        plan_filename=plan_filename,
-    )
-    prompt = TESTS_FIXER_PROMPT_TEMPLATE.format(
-        plan_content=plan_content,
-        max_retries=max_retries,
-    )
-
-    async for message in run_agent_query(
-        prompt=prompt,
-        system_prompt=system_prompt,
-        allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
-        permission_mode="acceptEdits",
-        cwd=cwd,
-        mcp_config_path=mcp_config_path,
-    ):
-        print_agent_message(message)
+    cwd = resolve_workspace_path(workspace_path)
+
+    system_prompt = TESTS_FIXER_SYSTEM_PROMPT.format(plan_filename=plan_filename)
+    setup_cmd, test_cmd = _extract_plan_commands(plan_content)
+    previous_hash = await _working_tree_hash(cwd)
+
+    for attempt in range(1, max_retries + 1):
+        prompt = TESTS_FIXER_PROMPT_TEMPLATE.format(
+            plan_content=plan_content,
+            attempt=attempt,
+            max_retries=max_retries,
+            setup_cmd=setup_cmd or "(none provided; see plan)",
+            test_cmd=test_cmd or "(none provided; see plan)",
+        )
+        await drain_agent_messages(
+            run_agent_query(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
+                permission_mode="acceptEdits",
+                cwd=cwd,
+                mcp_config_path=mcp_config_path,
+            )
+        )
+
+        if test_cmd:
+            returncode = await _run_test_command(test_cmd, cwd)
+            if returncode == 0:
+                logger.info("Planned tests pass after fix attempt %d/%d", attempt, max_retries)
+                return
+
+        tree_hash = await _working_tree_hash(cwd)
+        if tree_hash is not None and tree_hash == previous_hash:
+            logger.info(
+                "Fix attempt %d/%d changed nothing; stopping (fixed point reached)",
+                attempt,
+                max_retries,
+            )
+            return
+        previous_hash = tree_hash
+
+        if attempt < max_retries:
+            # Back off before re-hitting a possibly rate-limited LLM endpoint.
+            await asyncio.sleep(min(2**attempt, 30))
 
 
 async def try_fix_tests(
     workspace_path: Path | None = None,
     mcp_config_path: Path | None = None,
     max_retries: int = 10,
+    code_extensions: set[str] | None = None,
+    skip_patterns: list[str] | None = None,
 ) -> None:
     """
     Plan tests from staged changes, run and fix until passing, then stage only
     the fixer's changes. Never writes new tests. If no relevant existing tests
     are found, does nothing and returns.
 
+    Staged sets touching no code files (docs/config-only commits) are rejected
+    with one git call and zero agent runs.
+
     Args:
         workspace_path: Path to the workspace root. Defaults to current directory.
         mcp_config_path: Optional path to MCP config file.
         max_retries: Maximum number of fix-and-rerun cycles for the fixer.
+        code_extensions: File extensions considered code. Defaults to CODE_EXTENSIONS.
+        skip_patterns: Glob patterns excluded even when the extension matches.
+            Defaults to SKIP_PATTERNS.
     """
+    cwd = resolve_workspace_path(workspace_path)
+    extensions = code_extensions if code_extensions is not None else CODE_EXTENSIONS
+    patterns = skip_patterns if skip_patterns is not None else SKIP_PATTERNS
+    staged_files = await _staged_file_names(cwd)
+    if not any(_is_code_file(name, extensions, patterns) for name in staged_files):
+        logger.info("Staged changes are non-code; skipping test pipeline")
+        return
     plan_path = await plan_tests(
         workspace_path=workspace_path,
         mcp_config_path=mcp_config_path,
@@ -175,8 +425,7 @@ async def try_fix_tests(
     if plan_path is None:
         logger.info("No relevant existing tests found for staged changes. Skipping test run.")
         return
-    plan_content = plan_path.read_text()
-    plan_path.unlink(missing_ok=True)
+    plan_content = await asyncio.to_thread(consume_plan_file, plan_path)
     await fix_tests(
         plan_content=plan_content,
         plan_filename=plan_path.name,
@@ -1,12 +1,30 @@
+import asyncio
+import functools
 import logging
+import time
 from pathlib import Path
 
-from src.agents.base import extract_session_id, print_agent_message, run_agent_query
+from src.agents.base import (
+    DedupPrinter,
+    PlanWriteWatcher,
+    collect_staged_context,
+    consume_plan_file,
+    drain_agent_messages,
+    extract_session_id,
+    resolve_workspace_path,
+    run_agent_query,
+)
 from src.clients.jira_client import JiraIssue
-from src.exceptions import PlanNotFoundError
+from src.exceptions import AgentTimeoutError, PlanNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Budgets per ticket: a looping agent otherwise spends tokens and wall time
+# indefinitely while holding a fan-out semaphore slot. The turn cap applies to
+# each phase query; the time budget spans all phases of one ticket.
+DEFAULT_SOLVER_MAX_TURNS = 25
+DEFAULT_SOLVER_TIMEOUT_S = 600.0
+
 PLANNING_PHASE_SYSTEM_PROMPT = """
 You are an expert Software Engineer in the PLANNING phase of implementing a Jira ticket.
 
@@ -107,7 +125,8 @@ DO NOT add tests for:
 - Minor feature additions to tested modules
 
 Your role:
-1. Review the staged changes (git diff --cached)
+1. Review the staged changes provided inline in the prompt — do NOT re-run
+   `git diff`
 2. Check existing test coverage for the modified areas
 3. ONLY if one of the rare situations above applies, write minimal focused tests
 4. If you add tests, use `git add` to stage them
@@ -123,7 +142,7 @@ CRITICAL RULES:
 """
 
 TEST_WRITER_PHASE_PROMPT_TEMPLATE = """
-Review the staged changes and determine if new tests are truly needed.
+Review the staged changes below and determine if new tests are truly needed.
 
 Issue Key: {issue_key}
 Summary: {summary}
@@ -132,19 +151,29 @@ Remember: Most changes do NOT need new tests. Only add tests for new complex/ris
 without existing coverage, or entirely new modules.
 
 Steps:
-1. Run `git diff --cached` to see what was changed
+1. Review the staged changes provided below (do NOT re-run `git diff`)
 2. Check if existing tests already cover these changes
 3. Only if truly needed (rare), write minimal tests
 4. Run `git add` to stage ONLY the test files you created
+
+Staged files:
+{staged_files}
+
+Staged diff:
+{staged_diff}
 """
 
 
-async def plan_ticket(
-    issue: JiraIssue, workspace_path: Path | None = None, mcp_config_path: Path | None = None
-) -> tuple[Path, str]:
-    final_workspace_path = workspace_path.expanduser() if workspace_path else Path.cwd()
-    plan_path = final_workspace_path / "PLAN.md"
-    issue_context = {
+@functools.lru_cache(maxsize=128)
+def _issue_context(issue: JiraIssue) -> dict[str, str]:
+    """
+    Build the prompt-template context for an issue, memoized per issue.
+
+    All phases format their templates from the same fields; caching on the
+    (frozen, hashable) JiraIssue builds the dict once per ticket instead of
+    once per phase.
+    """
+    return {
         "issue_key": issue.key,
         "issue_type": issue.type or "Unknown",
         "status": issue.status or "Unknown",
@@ -153,23 +182,39 @@ async def plan_ticket(
         "description": issue.description or "No description provided",
     }
 
-    planning_prompt = PLANNING_PHASE_PROMPT_TEMPLATE.format(**issue_context)
+
+async def plan_ticket(
+    issue: JiraIssue,
+    workspace_path: Path | None = None,
+    mcp_config_path: Path | None = None,
+    max_turns: int | None = None,
+) -> tuple[Path, str]:
+    final_workspace_path = resolve_workspace_path(workspace_path)
+    plan_path = final_workspace_path / "PLAN.md"
+
+    planning_prompt = PLANNING_PHASE_PROMPT_TEMPLATE.format(**_issue_context(issue))
 
     session_id = None
-    async for message in run_agent_query(
+    messages = run_agent_query(
         prompt=planning_prompt,
         system_prompt=PLANNING_PHASE_SYSTEM_PROMPT,
         allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],  # Can write PLAN.md
         cwd=workspace_path,
         mcp_config_path=mcp_config_path,
-    ):
-        if session_id is None:
-            session_id = extract_session_id(message)
-            if session_id:
-                continue
-        print_agent_message(message)
-
-    if not plan_path.exists():
+        max_turns=max_turns,
+    )
+    # Only the init message (first or near-first in the stream) carries the
+    # session_id; check until it shows up, then drain the rest of the stream
+    # without the per-message check.
+    watcher = PlanWriteWatcher(plan_path, printer=DedupPrinter())
+    async for message in messages:
+        session_id = extract_session_id(message)
+        if session_id is not None:
+            break
+        watcher(message)
+    await drain_agent_messages(messages, printer=watcher)
+
+    if not watcher.wrote_file and not plan_path.exists():
         raise PlanNotFoundError(plan_path)
 
     return plan_path, str(session_id)
@@ -181,34 +226,30 @@ async def execute_plan(
     plan_path: Path,
     workspace_path: Path | None = None,
     mcp_config_path: Path | None = None,
+    max_turns: int | None = None,
 ) -> None:
     if not plan_path.exists():
         raise PlanNotFoundError(plan_path)
 
-    # Read plan content and delete the file to prevent accidental git add
-    plan_content = plan_path.read_text()
-    plan_path.unlink()
+    # Read plan content and delete the file to prevent accidental git add;
+    # in a worker thread so disk latency doesn't stall the event loop.
+    plan_content = await asyncio.to_thread(consume_plan_file, plan_path)
 
-    issue_context = {
-        "issue_key": issue.key,
-        "issue_type": issue.type or "Unknown",
-        "status": issue.status or "Unknown",
-        "summary": issue.summary,
-        "url": issue.url,
-        "description": issue.description or "No description provided",
-        "plan_content": plan_content,
-    }
-    execution_prompt = EXECUTION_PHASE_PROMPT_TEMPLATE.format(**issue_context)
+    execution_prompt = EXECUTION_PHASE_PROMPT_TEMPLATE.format(
+        plan_content=plan_content, **_issue_context(issue)
+    )
 
-    async for message in run_agent_query(
-        prompt=execution_prompt,
-        system_prompt=EXECUTION_PHASE_SYSTEM_PROMPT,
-        allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],  # Full access
-        cwd=workspace_path,
-        mcp_config_path=mcp_config_path,
-        session_id=session_id,
-    ):
-        print_agent_message(message)
+    await drain_agent_messages(
+        run_agent_query(
+            prompt=execution_prompt,
+            system_prompt=EXECUTION_PHASE_SYSTEM_PROMPT,
+            allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],  # Full access
+            cwd=workspace_path,
+            mcp_config_path=mcp_config_path,
+            session_id=session_id,
+            max_turns=max_turns,
+        )
+    )
 
 
 async def write_tests_if_needed(
@@ -216,6 +257,7 @@ async def write_tests_if_needed(
     session_id: str,
     workspace_path: Path | None = None,
     mcp_config_path: Path | None = None,
+    max_turns: int | None = None,
 ) -> None:
     """
     Evaluate staged changes and add tests only if truly needed.
@@ -224,21 +266,26 @@ async def write_tests_if_needed(
     - New complex/risky logic without existing test coverage
     - Entirely new modules or components
     """
-    issue_context = {
-        "issue_key": issue.key,
-        "summary": issue.summary,
-    }
-    test_writer_prompt = TEST_WRITER_PHASE_PROMPT_TEMPLATE.format(**issue_context)
+    cwd = resolve_workspace_path(workspace_path)
+    staged_files, staged_diff = await collect_staged_context(cwd)
+    test_writer_prompt = TEST_WRITER_PHASE_PROMPT_TEMPLATE.format(
+        issue_key=issue.key,
+        summary=issue.summary,
+        staged_files=staged_files or "(none)",
+        staged_diff=staged_diff or "(empty)",
+    )
 
-    async for message in run_agent_query(
-        prompt=test_writer_prompt,
-        system_prompt=TEST_WRITER_PHASE_SYSTEM_PROMPT,
-        allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
-        cwd=workspace_path,
-        mcp_config_path=mcp_config_path,
-        session_id=session_id,
-    ):
-        print_agent_message(message)
+    await drain_agent_messages(
+        run_agent_query(
+            prompt=test_writer_prompt,
+            system_prompt=TEST_WRITER_PHASE_SYSTEM_PROMPT,
+            allowed_tools=["Glob", "Bash", "Read", "Grep", "Write"],
+            cwd=workspace_path,
+            mcp_config_path=mcp_config_path,
+            session_id=session_id,
+            max_turns=max_turns,
+        )
+    )
 
 
 async def try_solve_ticket(
@@ -246,6 +293,8 @@ async def try_solve_ticket(
     workspace_path: Path | None = None,
     mcp_config_path: Path | None = None,
     enable_test_writer: bool = False,
+    max_turns: int | None = DEFAULT_SOLVER_MAX_TURNS,
+    timeout_s: float | None = DEFAULT_SOLVER_TIMEOUT_S,
 ) -> str:
     """
     Solve a Jira ticket using a Plan-Act workflow with Claude Agent SDK.
@@ -260,16 +309,58 @@ async def try_solve_ticket(
         workspace_path: Optional path to workspace root. Defaults to current directory.
         mcp_config_path: Optional path to mcp.json configuration file.
         enable_test_writer: Whether to run the test writer phase. Defaults to False.
+        max_turns: Per-phase cap on agent turns; None removes the cap.
+        timeout_s: Wall-time budget across all phases; None removes the budget.
+            A timeout during planning raises, since there is nothing to salvage;
+            a timeout during later phases keeps whatever the agent staged so the
+            caller can still produce a partial commit and draft PR.
 
     Returns:
         The session_id from the conversation
+
+    Raises:
+        AgentTimeoutError: If the time budget expires before planning finishes.
     """
-    plan_path, session_id = await plan_ticket(issue, workspace_path, mcp_config_path)
+    started = time.monotonic()
+
+    def _remaining() -> float | None:
+        return None if timeout_s is None else timeout_s - (time.monotonic() - started)
+
+    try:
+        plan_path, session_id = await asyncio.wait_for(
+            plan_ticket(issue, workspace_path, mcp_config_path, max_turns=max_turns),
+            timeout=_remaining(),
+        )
+    except asyncio.TimeoutError:
+        raise AgentTimeoutError(issue.key, timeout_s or 0) from None
     logger.info(
         "Plan file created at - %s. Now running the executor agent to implement it.", str(plan_path)
     )
-    await execute_plan(issue, session_id, plan_path, workspace_path, mcp_config_path)
+    try:
+        await asyncio.wait_for(
+            execute_plan(
+                issue, session_id, plan_path, workspace_path, mcp_config_path, max_turns=max_turns
+            ),
+            timeout=_remaining(),
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Execution for %s hit the %ss time budget; continuing with staged work so far",
+            issue.key,
+            timeout_s,
+        )
+        return session_id
     if enable_test_writer:
         logger.info("Evaluating if new tests are needed for the changes.")
-        await write_tests_if_needed(issue, session_id, workspace_path, mcp_config_path)
+        try:
+            await asyncio.wait_for(
+                write_tests_if_needed(
+                    issue, session_id, workspace_path, mcp_config_path, max_turns=max_turns
+                ),
+                timeout=_remaining(),
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Test writing for %s hit the %ss time budget; skipping", issue.key, timeout_s
+            )
     return session_id
@@ -1,20 +1,50 @@
+import asyncio
+import functools
 import logging
 import re
-from datetime import datetime
+import time
 
 from src.clients.github_client import GitHubClient
 from src.clients.jira_client import JiraClient, JiraIssue
+from src.exceptions import GithubBranchAlreadyExistsError
 
 logger = logging.getLogger(__name__)
 
 
+class _SanitizeTable(dict[int, str]):
+    """str.translate table mapping every char outside [a-z0-9-] to a hyphen."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return "-"
+
+
+# Built once at import: identity for allowed chars, lowercase for A-Z, and the
+# __missing__ fallback hyphenates everything else in one C-level pass —
+# replaces the per-call lower() + character-class re.sub.
+_SANITIZE_TABLE = _SanitizeTable(
+    {ord(char): char for char in "abcdefghijklmnopqrstuvwxyz0123456789-"}
+    | {ord(char): char.lower() for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+)
+_MULTI_HYPHEN = re.compile(r"-{2,}")
+_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+
+
+@functools.cache
+def _run_timestamp() -> str:
+    """Timestamp frozen on first use, shared by every branch name in this run.
+
+    A per-call timestamp would give a retried creation a different name,
+    making the "branch already exists => reuse" path unreachable; a per-run
+    value keeps names deterministic within the process while still avoiding
+    collisions between runs.
+    """
+    return time.strftime(_TIMESTAMP_FORMAT)
+
+
 def sanitize_branch_name(name: str, max_length: int = 100) -> str:
-    name = name.lower()
-    # Replace any character that's not a lowercase letter, digit, or hyphen with a hyphen
-    name = re.sub(r"[^a-z0-9-]", "-", name)
-    # Replace one or more consecutive hyphens with a single hyphen
-    name = re.sub(r"-+", "-", name)
-    name = name.strip("-")
+    # Lowercase and hyphenate disallowed characters in a single translate
+    # pass, then collapse consecutive hyphens with one precompiled pattern
+    name = _MULTI_HYPHEN.sub("-", name.translate(_SANITIZE_TABLE)).strip("-")
     if len(name) > max_length:
         name = name[:max_length].rstrip("-")
     return name
@@ -31,28 +61,54 @@ def generate_branch_name(
     if issue_type:
         branch_name = f"{issue_type.lower()}/{branch_name}"
 
-    # Add timestamp suffix to ensure uniqueness and avoid an extra
-    # API call to check if branch exists
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    suggested_branch_name = f"{branch_name}-{timestamp}"
-    if len(suggested_branch_name) > max_length:
-        chars_count_to_remove = len(suggested_branch_name) - max_length
-        branch_name = branch_name[:-chars_count_to_remove]
+    # Add timestamp suffix to ensure uniqueness across runs and avoid an
+    # extra API call to check if branch exists. The value is per-run, not
+    # per-call, so a retry within this process regenerates the same name.
+    timestamp = _run_timestamp()
+    # "-" + 14-digit timestamp; check the length without building the
+    # suggested name twice
+    suffix_length = len(timestamp) + 1
+    if len(branch_name) + suffix_length > max_length:
+        branch_name = branch_name[: max_length - suffix_length]
 
     return f"{branch_name}-{timestamp}"
 
 
-def create_branch_from_jira_issue(
+async def create_branch_from_jira_issue(
     jira_issue: JiraIssue,
     jira_client: JiraClient,
     github_client: GitHubClient,
     base_branch: str = "main",
 ) -> str:
+    """
+    Create the GitHub branch and link it on the Jira issue concurrently.
+
+    The Jira link only needs the branch URL, which is deterministic from the
+    branch name, so both network calls run in parallel. If branch creation
+    fails after the link was added, the link is removed as compensation.
+
+    An already-existing branch counts as success: the branch name is
+    deterministic for a given issue within one run, so "already exists" means
+    a previous attempt (e.g. a retry after a dropped response) got through,
+    and failing here would double-penalize an operation that worked.
+    """
     branch_name = generate_branch_name(jira_issue.key, jira_issue.summary, jira_issue.type)
-    # TODO: Consider replacing the 2 next lines with local git client
-    base_ref = github_client.get_base_branch_ref(base_branch)
+    branch_url = github_client.branch_url(branch_name)
 
-    branch_url = github_client.create_branch(branch_name, base_ref)
-    jira_client.link_branch(jira_issue.key, branch_url, branch_name)
+    create_result, link_result = await asyncio.gather(
+        asyncio.to_thread(github_client.create_branch_from_base, branch_name, base_branch),
+        asyncio.to_thread(jira_client.link_branch, jira_issue.key, branch_url, branch_name),
+        return_exceptions=True,
+    )
+    if isinstance(create_result, GithubBranchAlreadyExistsError):
+        logger.info("Branch %s already exists; reusing it", branch_name)
+        create_result = branch_url
+    if isinstance(create_result, BaseException):
+        if not isinstance(link_result, BaseException):
+            logger.info("Branch creation failed; removing Jira link for %s", branch_name)
+            await asyncio.to_thread(jira_client.unlink_branch, jira_issue.key, branch_url)
+        raise create_result
+    if isinstance(link_result, BaseException):
+        raise link_result
 
     return branch_name
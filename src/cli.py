@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import os
 import shutil
 import sys
 import tempfile
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -25,16 +29,14 @@ from src.console_utils import (
     print_success,
     print_warning,
 )
-from src.enhanced_git import EnhancedGit
-from src.exceptions import GitCloneError
-from src.logging_setup import LoggerHandlerType, SetupLoggerParams, setup_logger
-from src.settings import AppSettings
-
-logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from src.clients.github_client import GitHubClient
     from src.clients.jira_client import JiraClient
+    from src.enhanced_git import EnhancedGit
+    from src.settings import AppSettings
+
+logger = logging.getLogger(__name__)
 
 app = typer.Typer(
     name="ticket2pr",
@@ -45,10 +47,30 @@ app = typer.Typer(
 )
 
 
-def _load_settings() -> AppSettings:
+# Built once at import; settings_exist and _init both point here.
+_CONFIG_FILE = Path.home() / ".ticket2pr" / "config.toml"
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """Load .env at most once per process (skipped with TICKET2PR_SKIP_DOTENV)."""
+    global _dotenv_loaded
+    if _dotenv_loaded or os.environ.get("TICKET2PR_SKIP_DOTENV"):
+        return
     from dotenv import load_dotenv
 
     load_dotenv()
+    _dotenv_loaded = True
+
+
+@functools.cache
+def _load_settings() -> AppSettings:
+    # Cached: AppSettings() walks pydantic-settings sources (env, dotenv,
+    # toml), costing dozens of stats; one CLI process needs it once.
+    from src.settings import AppSettings
+
+    _load_dotenv_once()
     try:
         return AppSettings()
     except Exception as e:
@@ -80,21 +102,78 @@ def _init() -> None:
     initialize_settings(config_path)
 
 
+# Trash entries left behind by interrupted runs are swept once they are
+# older than this.
+_TRASH_MAX_AGE_SECONDS = 3600
+
+
+def _rmtree_in_background(path: Path) -> None:
+    threading.Thread(
+        target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+
+def _sweep_trash(trash_root: Path) -> None:
+    """Delete trash entries older than an hour left behind by earlier runs."""
+    cutoff = time.time() - _TRASH_MAX_AGE_SECONDS
+    try:
+        entries = list(trash_root.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                _rmtree_in_background(entry)
+        except OSError:
+            continue
+
+
+def _discard_temp_dir(temp_dir: Path) -> None:
+    """
+    Move a temp clone into the trash dir and delete it in the background.
+
+    rmtree over .git/objects is seconds of blocking syscalls the user would
+    otherwise wait through; os.rename into a sibling trash directory is
+    atomic on the same filesystem, so the shell prompt returns immediately.
+    Entries whose deleter thread died with the process are swept by the
+    next run.
+    """
+    trash_root = Path(tempfile.gettempdir()) / "ticket2pr" / "trash"
+    trash_root.mkdir(parents=True, exist_ok=True)
+    trashed = trash_root / f"{temp_dir.name}-{os.getpid()}"
+    os.rename(temp_dir, trashed)
+    _rmtree_in_background(trashed)
+    _sweep_trash(trash_root)
+
+
 @contextmanager
 def _setup_workspace(
     workspace_path_arg: Path | None,
     workspace_path_settings: Path | None,
     github_client: GitHubClient,
+    base_branch: str,
 ) -> Generator[tuple[EnhancedGit, Path]]:
     """
     Set up the workspace for the workflow.
 
     If no workspace_path is provided (neither arg nor settings), clones the repository
-    to a temp directory and cleans it up when done.
+    to a temp directory and cleans it up when done. The temp clone is a
+    blobless depth-1 clone of the base branch, falling back to a full clone
+    for servers without partial-clone support.
 
     Yields:
         A tuple of (EnhancedGit instance, workspace_path)
     """
+    from src.enhanced_git import EnhancedGit
+    from src.exceptions import GitCloneError
+
+    def clone(clone_url: str, target_path: Path) -> EnhancedGit:
+        try:
+            return EnhancedGit.clone_repo(clone_url, target_path, shallow=True, branch=base_branch)
+        except GitCloneError:
+            logger.warning("Partial clone failed, retrying with a full clone: %s", clone_url)
+            return EnhancedGit.clone_repo(clone_url, target_path)
+
     workspace_path = workspace_path_arg or workspace_path_settings
     temp_dir: Path | None = None
     try:
@@ -109,12 +188,12 @@ def _setup_workspace(
             )
             try:
                 logger.info("Attempting to clone via SSH: %s", github_client.ssh_url)
-                local_git = EnhancedGit.clone_repo(github_client.ssh_url, temp_dir)
+                local_git = clone(github_client.ssh_url, temp_dir)
             except GitCloneError:
                 logger.warning(
                     "SSH clone failed, falling back to HTTPS: %s", github_client.clone_url
                 )
-                local_git = EnhancedGit.clone_repo(github_client.clone_url, temp_dir)
+                local_git = clone(github_client.clone_url, temp_dir)
             logger.info("Repository cloned successfully")
             yield local_git, temp_dir
         else:
@@ -123,7 +202,7 @@ def _setup_workspace(
         if temp_dir and temp_dir.exists():
             logger.info("Cleaning up temp directory: %s", temp_dir)
             try:
-                shutil.rmtree(temp_dir)
+                _discard_temp_dir(temp_dir)
             except Exception as e:
                 logger.warning("Failed to clean up temp directory '%s': %s", temp_dir, e)
 
@@ -169,9 +248,61 @@ async def workflow_with_prints(
     print_success(final_msg)
 
 
+async def workflows_with_prints(
+    jira_issue_keys: list[str],
+    workspace_path: Path,
+    base_branch: str,
+    github_client: GitHubClient,
+    jira_client: JiraClient,
+    local_git: EnhancedGit,
+    mcp_config_path: Path | None = None,
+    commit_no_verify: bool = False,
+    fix_tests: bool = False,
+    max_concurrency: int = 4,
+) -> None:
+    """Fan several tickets out through run_workflows and print per-key outcomes."""
+    header_msg = f"Running workflows for {format_yellow(', '.join(jira_issue_keys))}"
+    print_info(header_msg)
+    print_label_value("Workspace", workspace_path)
+    print_label_value("Base branch", base_branch)
+    print_label_value("Github repository", github_client.repo.full_name)
+    print_label_value("Max concurrency", max_concurrency)
+    print_empty_line()
+
+    from src.workflow import run_workflows
+
+    results = await run_workflows(
+        jira_issue_keys,
+        max_concurrency=max_concurrency,
+        github_client=github_client,
+        jira_client=jira_client,
+        git=local_git,
+        base_branch=base_branch,
+        mcp_config_path=mcp_config_path,
+        commit_no_verify=commit_no_verify,
+        fix_tests=fix_tests,
+    )
+
+    failures = 0
+    for issue_key, result in zip(jira_issue_keys, results, strict=True):
+        if isinstance(result, BaseException):
+            failures += 1
+            print_error(f"{issue_key}: {result}")
+        else:
+            print_success(
+                format_success_with_checkmark(f"{issue_key}: {result.pr_url}"),
+                title=issue_key,
+            )
+    if failures:
+        msg = f"{failures} of {len(jira_issue_keys)} workflows failed"
+        raise RuntimeError(msg)
+
+
 @app.command()
 def run(
-    jira_issue_key: str = typer.Argument(..., help="Jira issue key (e.g., PROJ-123)"),
+    jira_issue_keys: list[str] = typer.Argument(  # noqa: B008
+        ..., help="Jira issue key(s) (e.g., PROJ-123) or browse URL(s)"
+    ),
     workspace_path: Path | None = typer.Option(  # noqa: B008
         None, "--workspace-path", "-w", help="Workspace path (overrides settings)"
     ),
@@ -193,8 +324,21 @@ def run(
         "-t",
         help="plan and run tests from staged changes, fix failures, then stage only fix changes",
     ),
+    max_concurrency: int = typer.Option(
+        4,
+        "--max-concurrency",
+        help="maximum number of tickets processed concurrently when several keys are given",
+    ),
 ) -> None:
-    """Execute the workflow for a specific Jira ticket."""
+    """Execute the workflow for one or more Jira tickets."""
+    from src.logging_setup import LoggerHandlerType, SetupLoggerParams, setup_logger
+    from src.validators import validate_jira_input
+
+    try:
+        jira_issue_keys = [validate_jira_input(key) for key in jira_issue_keys]
+    except ValueError as e:
+        print_error_inline(str(e))
+        sys.exit(1)
 
     settings = _load_settings()
 
@@ -215,14 +359,16 @@ def run(
             print_error(str(e))
             sys.exit(1)
 
-    with _setup_workspace(workspace_path, settings.core.workspace_path, github_client) as (
+    with _setup_workspace(
+        workspace_path, settings.core.workspace_path, github_client, final_base_branch
+    ) as (
         local_git,
         final_workspace_path,
     ):
         try:
-            asyncio.run(
-                workflow_with_prints(
-                    jira_issue_key,
+            if len(jira_issue_keys) == 1:
+                runner = workflow_with_prints(
+                    jira_issue_keys[0],
                     final_workspace_path,
                     final_base_branch,
                     github_client,
@@ -232,7 +378,25 @@ def run(
                     commit_no_verify,
                     fix_tests,
                 )
-            )
+            else:
+                runner = workflows_with_prints(
+                    jira_issue_keys,
+                    final_workspace_path,
+                    final_base_branch,
+                    github_client,
+                    jira_client,
+                    local_git,
+                    mcp_config_path,
+                    commit_no_verify,
+                    fix_tests,
+                    max_concurrency,
+                )
+            asyncio.run(runner)
+            # One summary line per stage, slowest first, so a slow run says
+            # where the time went without re-running under DEBUG logging.
+            from src.metrics import log_stage_summary
+
+            log_stage_summary()
         except KeyboardInterrupt:
             print_empty_line()
             print_warning("Workflow interrupted by user")
@@ -254,9 +418,9 @@ def help_command(ctx: typer.Context) -> None:
     typer.echo(ctx.find_root().get_help())
 
 
+@functools.cache
 def settings_exist() -> bool:
-    config_file_path = Path.home() / ".ticket2pr" / "config.toml"
-    return config_file_path.exists()
+    return _CONFIG_FILE.exists()
 
 
 @app.callback(invoke_without_command=True)
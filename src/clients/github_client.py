@@ -1,17 +1,21 @@
+import functools
+import time
+from typing import Any
+
 from github import Github
 from github.GithubException import GithubException
-from github.GitRef import GitRef
+from github.Repository import Repository
 from pydantic import BaseModel
 
 from src.exceptions import (
     FetchGithubBranchServerError,
-    FetchGithubBranchUnknownError,
     GithubBranchAlreadyExistsError,
     GithubBranchCreationServerError,
     GithubBranchNotFoundError,
     GithubPRCreationError,
     GithubPRFetchError,
 )
+from src.resilience import retry_sync
 
 
 class FileDiff(BaseModel):
@@ -33,6 +37,38 @@ class PullRequestDetails(BaseModel):
     file_diff: list[FileDiff]
 
 
+# Max page size the GitHub REST API allows for PR file listings.
+_FILES_PER_PAGE = 100
+
+# Base-ref lookup and ref creation for create_branch_from_base; GraphQL lets
+# the oid read return the repository id and html url in the same response, so
+# branch creation needs no separate get_repo/get_git_ref REST round trips.
+_BASE_REF_QUERY = """
+query($owner: String!, $name: String!, $baseRef: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    url
+    ref(qualifiedName: $baseRef) { target { oid } }
+  }
+}
+"""
+
+_CREATE_REF_MUTATION = """
+mutation($repositoryId: ID!, $name: String!, $oid: GitObjectID!) {
+  createRef(input: {repositoryId: $repositoryId, name: $name, oid: $oid}) {
+    ref { name }
+  }
+}
+"""
+
+
+class _GraphQLError(Exception):
+    """A GraphQL response carried an `errors` array."""
+
+    def __init__(self, errors: list[dict[str, Any]]) -> None:
+        super().__init__("; ".join(str(error.get("message", error)) for error in errors))
+
+
 class GitHubClient:
     def __init__(
         self, github_token: str, repo_full_name: str, github_base_url: str | None = None
@@ -41,39 +77,137 @@ class GitHubClient:
             self.client = Github(base_url=github_base_url, login_or_token=github_token)
         else:
             self.client = Github(github_token)
-        self.repo = self.client.get_repo(repo_full_name)
+        self._token = github_token
+        self._api_base_url = github_base_url or "https://api.github.com"
+        self._repo_full_name = repo_full_name
+        self._open_prs_cache: tuple[float, dict[str, tuple[int, str]]] | None = None
+
+    @functools.cached_property
+    def repo(self) -> Repository:
+        # Deferred: get_repo is an HTTPS round trip, and commands like `init`
+        # or early validation failures never need it.
+        return self.client.get_repo(self._repo_full_name)
 
     @property
     def clone_url(self) -> str:
-        return self.repo.clone_url  # type: ignore[no-any-return]
+        return self.repo.clone_url
 
     @property
     def ssh_url(self) -> str:
-        return self.repo.ssh_url  # type: ignore[no-any-return]
+        return self.repo.ssh_url
+
+    def branch_url(self, branch_name: str) -> str:
+        """Deterministic web URL of a branch — no API round trip needed."""
+        web_base = self._api_base_url.removesuffix("/api/v3")
+        if web_base == "https://api.github.com":
+            web_base = "https://github.com"
+        return f"{web_base}/{self._repo_full_name}/tree/{branch_name}"
+
+    @functools.cached_property
+    def _session(self):  # type: ignore[no-untyped-def]
+        """Persistent authenticated session for direct REST/GraphQL calls."""
+        import requests
+
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self._token}",
+                "Accept": "application/vnd.github+json",
+            }
+        )
+        return session
+
+    @functools.cached_property
+    def _graphql_url(self) -> str:
+        """GraphQL endpoint for this host.
 
-    def get_base_branch_ref(self, base_branch: str) -> GitRef:
+        GitHub Enterprise serves GraphQL at `/api/graphql`, not under the
+        REST base's `/api/v3`; github.com keeps it at the REST base.
+        Mirrors the suffix-stripping in `branch_url`.
+        """
+        stripped = self._api_base_url.removesuffix("/api/v3")
+        if stripped != self._api_base_url:
+            return f"{stripped}/api/graphql"
+        return f"{self._api_base_url}/graphql"
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """POST one GraphQL request; return `data` or raise on transport errors."""
+        response = self._session.post(
+            self._graphql_url,
+            json={"query": query, "variables": variables},
+            timeout=30,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise _GraphQLError(payload["errors"])
+        return payload["data"]  # type: ignore[no-any-return]
+
+    def create_branch_from_base(self, branch_name: str, base_branch: str) -> str:
+        """
+        Create `branch_name` off the tip of `base_branch` and return its URL.
+
+        Fuses what used to be separate get_repo/get_git_ref/create_git_ref
+        REST calls into one GraphQL oid lookup plus one createRef mutation,
+        both pipelined over a persistent session sharing a single TLS
+        connection.
+        """
+        import requests
+
+        owner, name = self._repo_full_name.split("/", 1)
         try:
-            return self.repo.get_git_ref(f"heads/{base_branch}")
-        except GithubException as e:
-            if e.status == 404:
-                raise GithubBranchNotFoundError(base_branch, self.repo.full_name) from e
-            else:
-                raise FetchGithubBranchServerError(base_branch, str(e)) from e
-        except Exception as e:
-            raise FetchGithubBranchUnknownError(base_branch) from e
+            data = self._graphql(
+                _BASE_REF_QUERY,
+                {"owner": owner, "name": name, "baseRef": f"refs/heads/{base_branch}"},
+            )
+        except (requests.RequestException, _GraphQLError) as e:
+            raise FetchGithubBranchServerError(base_branch, str(e)) from e
 
-    def create_branch(self, branch_name: str, base_ref: GitRef) -> str:
-        branch_url = f"{self.repo.html_url}/tree/{branch_name}"
+        repository = data.get("repository")
+        if repository is None or repository.get("ref") is None:
+            raise GithubBranchNotFoundError(base_branch, self._repo_full_name)
 
         try:
-            self.repo.create_git_ref(ref=f"refs/heads/{branch_name}", sha=base_ref.object.sha)
-        except GithubException as e:
-            if e.status == 422:
+            self._graphql(
+                _CREATE_REF_MUTATION,
+                {
+                    "repositoryId": repository["id"],
+                    "name": f"refs/heads/{branch_name}",
+                    "oid": repository["ref"]["target"]["oid"],
+                },
+            )
+        except _GraphQLError as e:
+            if "already exists" in str(e):
                 raise GithubBranchAlreadyExistsError(branch_name) from e
-            else:
-                raise GithubBranchCreationServerError(branch_name, str(e)) from e
+            raise GithubBranchCreationServerError(branch_name, str(e)) from e
+        except requests.RequestException as e:
+            raise GithubBranchCreationServerError(branch_name, str(e)) from e
+
+        return f"{repository['url']}/tree/{branch_name}"
+
+    def list_open_prs_cached(self, ttl: float = 60.0) -> dict[str, tuple[int, str]]:
+        """
+        List open PRs keyed by head branch, cached per instance.
 
-        return branch_url
+        One paginated listing serves every "does a PR already exist for this
+        branch?" lookup in a fan-out locally instead of one search API round
+        trip per ticket.
+
+        Args:
+            ttl: Seconds the cached listing stays fresh (default: 60)
+
+        Returns:
+            Mapping of head branch name to (pr_number, pr_url)
+        """
+        now = time.monotonic()
+        cached = self._open_prs_cache
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        open_prs = {
+            pr.head.ref: (pr.number, pr.html_url) for pr in self.repo.get_pulls(state="open")
+        }
+        self._open_prs_cache = (now, open_prs)
+        return open_prs
 
     def create_pull_request(
         self,
@@ -96,6 +230,55 @@ class GitHubClient:
         else:
             return pr.number, pr.html_url
 
+    def _fetch_pr_files_parallel(self, pr_number: int, changed_files: int) -> list[FileDiff]:
+        """
+        Fetch all PR file pages concurrently instead of PyGithub's serial paging.
+
+        PyGithub lazily fetches one page per HTTP round trip; for a multi-page
+        PR those round trips serialize. The page count is known up front from
+        changed_files, so request every page at once over a shared session.
+        """
+        import math
+        from concurrent.futures import ThreadPoolExecutor
+
+        import requests
+
+        pages = math.ceil(changed_files / _FILES_PER_PAGE)
+        url = f"{self._api_base_url}/repos/{self._repo_full_name}/pulls/{pr_number}/files"
+
+        def fetch_page(page: int) -> list[dict[str, Any]]:
+            response = self._session.get(
+                url,
+                params={"per_page": _FILES_PER_PAGE, "page": page},
+                timeout=30,
+            )
+            response.raise_for_status()
+            return response.json()  # type: ignore[no-any-return]
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(pages, 10)) as pool:
+                file_pages = list(pool.map(fetch_page, range(1, pages + 1)))
+        except requests.RequestException as e:
+            raise GithubPRFetchError(pr_number) from e
+
+        # model_construct: the GitHub API payload is already typed, so skip
+        # pydantic validation on the per-file hot loop
+        return [
+            FileDiff.model_construct(
+                filename=file["filename"],
+                status=file["status"],
+                patch=file.get("patch"),
+                additions=file["additions"],
+                deletions=file["deletions"],
+                changes=file["changes"],
+            )
+            for page in file_pages
+            for file in page
+        ]
+
+    # Read-only, so retrying is safe; mutating calls (create_pull_request,
+    # create_branch_from_base) stay un-retried to avoid duplicate side effects.
+    @retry_sync("github", retry_on=(GithubPRFetchError,))
     def get_pull_request(self, pr_number: int) -> PullRequestDetails:
         """
         Get details of a pull request by its number.
@@ -112,15 +295,12 @@ class GitHubClient:
         try:
             pr = self.repo.get_pull(pr_number)
 
-            # Get all files changed in the PR
-            files = pr.get_files()
-
-            # Collect file diffs
-            file_diffs = []
-
-            for file in files:
-                file_diffs.append(
-                    FileDiff(
+            if pr.changed_files > _FILES_PER_PAGE:
+                # Multi-page file listing: fetch every page concurrently
+                file_diffs = self._fetch_pr_files_parallel(pr.number, pr.changed_files)
+            else:
+                file_diffs = [
+                    FileDiff.model_construct(
                         filename=file.filename,
                         status=file.status,
                         patch=file.patch,
@@ -128,9 +308,10 @@ class GitHubClient:
                         deletions=file.deletions,
                         changes=file.changes,
                     )
-                )
+                    for file in pr.get_files()
+                ]
 
-            return PullRequestDetails(
+            return PullRequestDetails.model_construct(
                 title=pr.title,
                 body=pr.body,
                 file_diff=file_diffs,
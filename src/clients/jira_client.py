@@ -1,14 +1,22 @@
+import time
+from contextlib import suppress
+
 from jira import JIRA, JIRAError
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from src.exceptions import (
     JiraIssueFetchServerError,
     JiraIssueFetchUnknownError,
     JiraIssueNotFoundError,
 )
+from src.resilience import retry_sync
 
 
 class JiraIssue(BaseModel):
+    # Frozen makes instances hashable so downstream helpers can memoize
+    # per-issue derived values (e.g. prompt contexts) on the issue itself.
+    model_config = ConfigDict(frozen=True)
+
     key: str
     summary: str
     url: str
@@ -19,13 +27,39 @@ class JiraIssue(BaseModel):
 
 
 class JiraClient:
+    # Tickets don't change mid-run; five minutes keeps repeat fetches of the
+    # same key free for the lifetime of a workflow fan-out without risking
+    # stale reads across separate invocations.
+    _ISSUE_CACHE_TTL = 300.0
+
     def __init__(self, url: str, username: str, password: str) -> None:
         self._client: JIRA = JIRA(server=url, basic_auth=(username, password))
         self._url: str = url
+        self._issue_cache: dict[str, tuple[float, JiraIssue]] = {}
+
+    # Only the fields fetch_issue actually consumes; without an allow-list
+    # Jira returns the whole issue document (comments, worklogs, attachments,
+    # custom fields), often 10-100x the bytes.
+    _ISSUE_FIELDS = "summary,description,issuetype,status"
 
     def fetch_issue(self, issue_key: str) -> JiraIssue:
+        """Fetch an issue, serving repeats from a per-instance TTL cache."""
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None:
+            fetched_at, issue = cached
+            if time.monotonic() - fetched_at < self._ISSUE_CACHE_TTL:
+                return issue
+        issue = self._fetch_issue_remote(issue_key)
+        self._issue_cache[issue_key] = (time.monotonic(), issue)
+        return issue
+
+    # Retry only server-side failures; a 404 maps to JiraIssueNotFoundError
+    # first and propagates immediately. The workflow runs this in a worker
+    # thread, so the blocking backoff never stalls the event loop.
+    @retry_sync("jira", retry_on=(JiraIssueFetchServerError,))
+    def _fetch_issue_remote(self, issue_key: str) -> JiraIssue:
         try:
-            issue = self._client.issue(issue_key)
+            issue = self._client.issue(issue_key, fields=self._ISSUE_FIELDS)
             issue_type = (
                 issue.fields.issuetype.name
                 if hasattr(issue.fields, "issuetype") and issue.fields.issuetype
@@ -36,7 +70,9 @@ class JiraClient:
                 if hasattr(issue.fields, "status") and issue.fields.status
                 else None
             )
-            return JiraIssue(
+            # model_construct: field values come straight from the Jira API
+            # client, so full pydantic validation adds nothing here
+            return JiraIssue.model_construct(
                 key=issue_key,
                 summary=issue.fields.summary,
                 url=f"{self._url}/browse/{issue_key}",
@@ -53,6 +89,10 @@ class JiraClient:
         except Exception as e:
             raise JiraIssueFetchUnknownError(issue_key) from e
 
+    @staticmethod
+    def _branch_link_global_id(branch_url: str) -> str:
+        return f"system=github&id={branch_url}"
+
     def link_branch(self, issue_key: str, branch_url: str, branch_name: str) -> None:
         link_object = {
             "url": branch_url,
@@ -62,10 +102,16 @@ class JiraClient:
                 "url16x16": "https://github.githubassets.com/favicons/favicon.png",
             },
         }
-        unique_id = f"system=github&id={branch_url}"
         self._client.add_remote_link(
             issue=issue_key,
             destination=link_object,
-            globalId=unique_id,
+            globalId=self._branch_link_global_id(branch_url),
             relationship="source",
         )
+
+    def unlink_branch(self, issue_key: str, branch_url: str) -> None:
+        """Remove the remote link created by link_branch (best effort)."""
+        with suppress(JIRAError):
+            self._client.delete_remote_link(
+                issue_key, global_id=self._branch_link_global_id(branch_url)
+            )
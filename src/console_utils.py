@@ -1,32 +1,101 @@
 """Unified console printing utilities for consistent formatting across the application."""
 
-from collections.abc import Generator
+from __future__ import annotations
+
+import functools
+import sys
 from contextlib import contextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from rich.panel import Panel
+    from rich.progress import Progress
+
+# rich.panel and rich.progress are imported inside the helpers that use
+# them: they pull in sizeable transitive module trees that plain-text
+# code paths (and CLI startup) never need.
 
 # Shared console instance for consistent styling
 console = Console()
 
-# Formatting constants (encapsulated)
-_BOLD_CYAN = "[bold cyan]"
-_BOLD_GREEN = "[bold green]"
-_BOLD_RED = "[bold red]"
-_BOLD = "[bold]"
-_CYAN = "[cyan]"
-_DIM = "[dim]"
-_GREEN = "[green]"
-_RED = "[red]"
-_YELLOW = "[yellow]"
-_RESET = "[/]"
+# When set (inside batched_output), renderables are collected here and
+# flushed with a single console.print call on exit. Each console.print
+# acquires the console lock, rebuilds segments, and issues its own
+# terminal write; coalescing bursts of small messages into one call
+# amortizes all of that.
+_batch_buffer: list[Any] | None = None
+
+
+def _emit(*renderables: Any) -> None:
+    """Print renderables now, or buffer them inside a batched_output block."""
+    if _batch_buffer is not None:
+        _batch_buffer.extend(renderables)
+        return
+    for renderable in renderables:
+        console.print(renderable)
+
+
+@contextmanager
+def batched_output() -> Generator[None]:
+    """Defer prints made through this module and flush them in one write.
+
+    Nested use keeps buffering until the outermost block exits.
+    """
+    global _batch_buffer
+    if _batch_buffer is not None:
+        yield
+        return
+    _batch_buffer = []
+    try:
+        yield
+    finally:
+        buffer, _batch_buffer = _batch_buffer, None
+        if buffer:
+            console.print(*buffer, sep="\n")
+
+
+# Formatting constants (encapsulated); interned so Rich's style-cache
+# dict lookups on these fragments hit by identity rather than by
+# character comparison.
+_BOLD_CYAN = sys.intern("[bold cyan]")
+_BOLD_GREEN = sys.intern("[bold green]")
+_BOLD_RED = sys.intern("[bold red]")
+_BOLD = sys.intern("[bold]")
+_CYAN = sys.intern("[cyan]")
+_DIM = sys.intern("[dim]")
+_GREEN = sys.intern("[green]")
+_RED = sys.intern("[red]")
+_YELLOW = sys.intern("[yellow]")
+_RESET = sys.intern("[/]")
+
+# Prefixes folded from the constants above at import time, so the hot
+# format_* helpers do a single concatenation per call instead of
+# rebuilding the markup from several literal pieces each time.
+_CHECK_PREFIX = _BOLD_GREEN + "✓ "
+_CROSS_PREFIX = _BOLD_RED + "✗ "
+_ERROR_PREFIX = _RED + "Error:" + _RESET + " "
+
+
+@functools.lru_cache(maxsize=64)
+def _make_panel(
+    content: str, border_style: str, title: str | None = None, fit: bool = True
+) -> Panel:
+    """Build (and memoize) a Panel; rendering a Panel does not mutate it,
+    so recurring headers like section titles reuse one renderable."""
+    from rich.panel import Panel
+
+    if fit:
+        return Panel.fit(content, border_style=border_style, title=title)
+    return Panel(content, border_style=border_style, title=title)
 
 
 def print_empty_line() -> None:
     """Print an empty line."""
-    console.print()
+    _emit("")
 
 
 def print_formatted(message: str, **kwargs: Any) -> None:
@@ -36,7 +105,11 @@ def print_formatted(message: str, **kwargs: Any) -> None:
         message: The message to print (supports rich markup)
         **kwargs: Additional arguments to pass to console.print()
     """
-    console.print(message, **kwargs)
+    if kwargs:
+        # Per-call print options cannot be batched; print directly.
+        console.print(message, **kwargs)
+    else:
+        _emit(message)
 
 
 def print_success(message: str, title: str | None = None) -> None:
@@ -46,15 +119,8 @@ def print_success(message: str, title: str | None = None) -> None:
         message: The success message to display (plain text, formatting applied internally)
         title: Optional title for the panel
     """
-    formatted_message = f"{_BOLD_GREEN}{message}{_RESET}"
-    console.print()
-    console.print(
-        Panel.fit(
-            formatted_message,
-            border_style="green",
-            title=title,
-        )
-    )
+    formatted_message = _BOLD_GREEN + message + _RESET
+    _emit("", _make_panel(formatted_message, "green", title=title))
 
 
 def print_error(message: str, title: str = "Error") -> None:
@@ -64,15 +130,8 @@ def print_error(message: str, title: str = "Error") -> None:
         message: The error message to display (plain text, formatting applied internally)
         title: Title for the error panel (default: "Error")
     """
-    formatted_message = f"{_BOLD_RED}{message}{_RESET}"
-    console.print()
-    console.print(
-        Panel.fit(
-            formatted_message,
-            border_style="red",
-            title=title,
-        )
-    )
+    formatted_message = _BOLD_RED + message + _RESET
+    _emit("", _make_panel(formatted_message, "red", title=title))
 
 
 def print_info(message: str) -> None:
@@ -81,14 +140,8 @@ def print_info(message: str) -> None:
     Args:
         message: The info message to display (plain text, formatting applied internally)
     """
-    formatted_message = f"{_BOLD_CYAN}{message}{_RESET}"
-    console.print()
-    console.print(
-        Panel.fit(
-            formatted_message,
-            border_style="cyan",
-        )
-    )
+    formatted_message = _BOLD_CYAN + message + _RESET
+    _emit("", _make_panel(formatted_message, "cyan"))
 
 
 def print_warning(message: str) -> None:
@@ -97,7 +150,7 @@ def print_warning(message: str) -> None:
     Args:
         message: The warning message to display (plain text, formatting applied internally)
     """
-    console.print(f"{_YELLOW}{message}{_RESET}")
+    _emit(_YELLOW + message + _RESET)
 
 
 def print_section(title: str) -> None:
@@ -106,9 +159,8 @@ def print_section(title: str) -> None:
     Args:
         title: The section title (plain text, formatting applied internally)
     """
-    formatted_title = f"{_BOLD}{title}{_RESET}"
-    console.print(Panel(formatted_title, border_style="blue"))
-    console.print()
+    formatted_title = _BOLD + title + _RESET
+    _emit(_make_panel(formatted_title, "blue", fit=False), "")
 
 
 def print_summary(content: str) -> None:
@@ -117,13 +169,7 @@ def print_summary(content: str) -> None:
     Args:
         content: The summary content to display (plain text, formatting applied internally)
     """
-    console.print(
-        Panel(
-            content,
-            border_style="green",
-        )
-    )
-    console.print()
+    _emit(_make_panel(content, "green", fit=False), "")
 
 
 def print_error_inline(message: str) -> None:
@@ -132,7 +178,7 @@ def print_error_inline(message: str) -> None:
     Args:
         message: The error message to display (plain text, formatting applied internally)
     """
-    console.print(f"{_RED}Error:{_RESET} {message}")
+    _emit(_ERROR_PREFIX + message)
 
 
 def print_label_value(label: str, value: Any) -> None:
@@ -142,7 +188,11 @@ def print_label_value(label: str, value: Any) -> None:
         label: The label text
         value: The value to display
     """
-    console.print(f"{_DIM}{label}:{_RESET} {value}")
+    if len(label) < 32:
+        # Labels repeat across calls (e.g. one per file in a listing);
+        # interning dedupes them so the formatted line reuses one object.
+        label = sys.intern(label)
+    _emit(f"{_DIM}{label}:{_RESET} {value}")
 
 
 def format_success_with_checkmark(message: str) -> str:
@@ -154,7 +204,7 @@ def format_success_with_checkmark(message: str) -> str:
     Returns:
         Formatted string with checkmark and green styling
     """
-    return f"{_BOLD_GREEN}✓ {message}{_RESET}"
+    return _CHECK_PREFIX + message + _RESET
 
 
 def format_error_with_cross(message: str) -> str:
@@ -166,7 +216,7 @@ def format_error_with_cross(message: str) -> str:
     Returns:
         Formatted string with cross and red styling
     """
-    return f"{_BOLD_RED}✗ {message}{_RESET}"
+    return _CROSS_PREFIX + message + _RESET
 
 
 def format_info_header(message: str) -> str:
@@ -178,7 +228,7 @@ def format_info_header(message: str) -> str:
     Returns:
         Formatted string with cyan styling
     """
-    return f"{_BOLD_CYAN}{message}{_RESET}"
+    return _BOLD_CYAN + message + _RESET
 
 
 def format_dim(message: str) -> str:
@@ -190,7 +240,7 @@ def format_dim(message: str) -> str:
     Returns:
         Formatted string with dim styling
     """
-    return f"{_DIM}{message}{_RESET}"
+    return _DIM + message + _RESET
 
 
 def format_cyan(message: str) -> str:
@@ -202,7 +252,7 @@ def format_cyan(message: str) -> str:
     Returns:
         Formatted string with cyan styling
     """
-    return f"{_CYAN}{message}{_RESET}"
+    return _CYAN + message + _RESET
 
 
 def format_yellow(message: str) -> str:
@@ -214,7 +264,7 @@ def format_yellow(message: str) -> str:
     Returns:
         Formatted string with yellow styling
     """
-    return f"{_YELLOW}{message}{_RESET}"
+    return _YELLOW + message + _RESET
 
 
 def format_bold(message: str) -> str:
@@ -226,7 +276,7 @@ def format_bold(message: str) -> str:
     Returns:
         Formatted string with bold styling
     """
-    return f"{_BOLD}{message}{_RESET}"
+    return _BOLD + message + _RESET
 
 
 def format_status_message(message: str) -> str:
@@ -238,7 +288,7 @@ def format_status_message(message: str) -> str:
     Returns:
         Formatted string with green styling
     """
-    return f"{_BOLD_GREEN}{message}{_RESET}"
+    return _BOLD_GREEN + message + _RESET
 
 
 @contextmanager
@@ -264,6 +314,8 @@ def get_progress() -> Generator[Progress]:
     Yields:
         A Progress instance configured with spinner and text columns
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -281,4 +333,4 @@ def format_progress_task(message: str) -> str:
     Returns:
         Formatted string with cyan styling
     """
-    return f"{_CYAN}{message}{_RESET}"
+    return _CYAN + message + _RESET
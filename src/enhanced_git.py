@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 import git
-from typing_extensions import Self
 
 from src.exceptions import (
     GitCloneError,
@@ -12,6 +15,9 @@ from src.exceptions import (
     NoStagedChangesError,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 class EnhancedGit:
     """
@@ -21,6 +27,11 @@ class EnhancedGit:
     multiple underlying git commands in sequence.
     """
 
+    # Opening a git.Repo scans .git, parses config, and loads refs; share
+    # handles across instances pointing at the same repository. Weak values
+    # let a handle die with its last EnhancedGit instead of pinning it.
+    _repo_cache: WeakValueDictionary[Path, git.Repo] = WeakValueDictionary()
+
     def __init__(self, repo_path: Path = Path(".")) -> None:
         """
         Initialize an EnhancedGit instance for a given repository path.
@@ -28,19 +39,36 @@ class EnhancedGit:
         Args:
             repo_path: Path to the git repository (default: current directory)
         """
-        if not repo_path.exists():
-            raise GitWorkspacePathNotExistsError(repo_path)
-        self.repo_path = repo_path.expanduser()
+        # Expand once up front: the exists() check must see the expanded
+        # path (a literal "~/..." never exists on disk), and every later
+        # git call reuses the stored result instead of re-expanding.
+        expanded = repo_path.expanduser()
+        if not expanded.exists():
+            raise GitWorkspacePathNotExistsError(expanded)
+        self.repo_path = expanded
         self._repo = None
 
     @classmethod
-    def clone_repo(cls, clone_url: str, target_path: Path) -> Self:
+    def clone_repo(
+        cls,
+        clone_url: str,
+        target_path: Path,
+        shallow: bool = False,
+        branch: str | None = None,
+    ) -> Self:
         """
         Clone a repository to the specified path and return an EnhancedGit instance.
 
         Args:
             clone_url: The URL of the repository to clone
             target_path: The path where the repository will be cloned
+            shallow: If True, do a blobless depth-1 clone
+                (--depth=1 --filter=blob:none --no-tags), which cuts
+                transferred bytes by orders of magnitude on repos with
+                history; tags are skipped since the workflow never reads
+                them. --no-single-branch keeps the default fetch refspec so
+                branches created later (e.g. the PR branch) stay fetchable
+            branch: Branch to check out initially when set (--branch)
 
         Returns:
             An EnhancedGit instance for the cloned repository
@@ -48,17 +76,30 @@ class EnhancedGit:
         Raises:
             GitCloneError: If cloning fails
         """
+        multi_options = []
+        if shallow:
+            multi_options += ["--depth=1", "--filter=blob:none", "--no-tags", "--no-single-branch"]
+        if branch:
+            multi_options.append(f"--branch={branch}")
         try:
-            git.Repo.clone_from(clone_url, target_path)
+            git.Repo.clone_from(clone_url, target_path, multi_options=multi_options or None)
         except Exception as e:
             raise GitCloneError(clone_url, str(e)) from e
+        # A stale handle for this path (e.g. from a previous clone into the
+        # same directory) must not survive the re-clone.
+        cls._repo_cache.pop(target_path.resolve(), None)
         return cls(target_path)
 
     @property
     def repo(self) -> git.Repo:
-        """Lazy-load the git repository."""
+        """Lazy-load the git repository, reusing a cached handle per path."""
         if self._repo is None:
-            self._repo = git.Repo(self.repo_path)
+            key = self.repo_path.resolve()
+            repo = EnhancedGit._repo_cache.get(key)
+            if repo is None:
+                repo = git.Repo(self.repo_path)
+                EnhancedGit._repo_cache[key] = repo
+            self._repo = repo
         return self._repo
 
     def fetch_and_checkout_branch(self, branch_name: str) -> None:
@@ -86,6 +127,82 @@ class EnhancedGit:
         except Exception as e:
             raise GitFetchCheckoutUnknownError(str(e)) from e
 
+    async def background_prefetch(self, remote: str = "origin") -> bool:
+        """
+        Refresh remote-tracking refs in the background without blocking the loop.
+
+        Started while the solver runs, this makes the pack negotiation at
+        push time start from fresh refs, so the eventual push ships a minimal
+        delta. Failures are non-fatal: the later push fetches whatever it
+        still needs.
+
+        Args:
+            remote: Remote to fetch from (default: "origin")
+
+        Returns:
+            True if the fetch exited cleanly, False otherwise
+        """
+        import asyncio
+        import shutil
+
+        process = await asyncio.create_subprocess_exec(
+            shutil.which("git") or "git",
+            "fetch",
+            "--quiet",
+            "--no-tags",
+            remote,
+            cwd=self.repo_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await process.wait() == 0
+
+    def create_worktree(self, base_branch: str, worktree_dir: Path) -> Self:
+        """
+        Add a linked worktree detached at `base_branch` and wrap it.
+
+        Worktrees share the object store with this repository, so creating
+        one costs a checkout rather than a clone, and concurrent workflows
+        each get their own working tree to mutate.
+
+        The HEAD is detached because git refuses to check the same branch
+        out in two worktrees, and `base_branch` is normally checked out in
+        this repository already (the workspace clone uses `--branch`). The
+        workflow switches to its per-ticket branch right after, so the
+        detached state is momentary.
+
+        Args:
+            base_branch: Branch whose tip the new worktree starts from
+            worktree_dir: Directory to create the worktree in (must not exist
+                or be empty)
+
+        Returns:
+            An EnhancedGit instance for the new worktree
+        """
+        self.repo.git.worktree("add", "--detach", str(worktree_dir), base_branch)
+        return type(self)(worktree_dir)
+
+    def remove_worktree(self, worktree_dir: Path) -> None:
+        """Remove a worktree created by `create_worktree` (forced, best effort)."""
+        self.repo.git.worktree("remove", "--force", str(worktree_dir))
+
+    def has_staged_changes(self) -> bool:
+        """
+        Check whether anything is staged, using git's exit code only.
+
+        `git diff --cached --quiet` exits non-zero when the index differs
+        from HEAD without producing or parsing any output, unlike
+        `is_dirty(untracked_files=True)` which runs a full O(tree) status
+        scan including untracked files.
+
+        Returns:
+            True if there are staged changes, False otherwise
+        """
+        status, _, _ = self.repo.git.diff(
+            "--cached", "--quiet", with_extended_output=True, with_exceptions=False
+        )
+        return status != 0  # type: ignore[no-any-return]
+
     def add_all_changes(self) -> None:
         """
         Add all changes to the staging area.
@@ -116,26 +233,30 @@ class EnhancedGit:
             Exception: If the directory is not a valid git repository or if push fails
         """
         try:
-            # Check if there are any changes to commit
-            if not self.repo.is_dirty(untracked_files=True):
+            # Check if there are any staged changes to commit
+            if not self.has_staged_changes():
                 print("No changes detected. Nothing to commit.")
                 return None
 
             if no_verify:
-                commit = self.repo.git.commit("-m", message, "--no-verify")
+                self.repo.git.commit("-m", message, "--no-verify")
                 commit = self.repo.head.commit
             else:
                 commit = self.repo.index.commit(message)
 
-            # Push to remote
+            # Push to remote; "HEAD" lets git resolve the current branch
+            # itself instead of a separate active_branch read here.
             remote_obj = self.repo.remote(name=remote)
-            current_branch = self.repo.active_branch.name
-            remote_obj.push(current_branch)
+            remote_obj.push("HEAD")
         except Exception as e:
             raise GitPushError from e
         else:
             return commit
 
+    def staged_diff(self) -> str:
+        """Return the staged diff text, or an empty string when nothing is staged."""
+        return self.repo.git.diff("--staged")  # type: ignore[no-any-return]
+
     def get_staged_changes(self) -> tuple[str, list[str]]:
         """
         Get staged changes and list of changed files.
@@ -148,10 +269,12 @@ class EnhancedGit:
         Raises:
             Exception: If no changes are staged
         """
-        staged_diff = self.repo.git.diff("--staged")
+        staged_diff = self.staged_diff()
         if not staged_diff:
             raise NoStagedChangesError
 
-        changed_file_paths = [item.a_path for item in self.repo.index.diff("HEAD")]
+        # --name-only keeps this a plain git call; index.diff("HEAD") would
+        # materialize a Python diff object per changed file just for a_path.
+        changed_file_paths = self.repo.git.diff("--staged", "--name-only").splitlines()
 
         return staged_diff, changed_file_paths
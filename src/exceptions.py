@@ -1,5 +1,31 @@
 from pathlib import Path
 
+# Message templates are bound once at import; each raise then does a single
+# str.format call instead of assembling the literal pieces per construction.
+_WORKSPACE_NOT_EXISTS_TEMPLATE = "Repository path does not exists locally - '{0}'"
+_FETCH_CHECKOUT_UNKNOWN_TEMPLATE = "Failed to fetch and checkout branch: {0}"
+_LOCAL_BRANCH_EXISTS_TEMPLATE = "Local branch '{0}' already exists"
+_CLONE_FAILED_TEMPLATE = "Failed to clone repository from '{0}': {1}"
+_FETCH_BRANCH_UNKNOWN_TEMPLATE = "Failed to find base branch '{0}': unknown error"
+_BRANCH_NOT_FOUND_TEMPLATE = "Failed to find base branch '{0}' on repository: '{1}'"
+_FETCH_BRANCH_SERVER_TEMPLATE = "Failed to find base branch '{0}'. Github server response: {1}"
+_BRANCH_EXISTS_TEMPLATE = "Error while creating branch '{0}': branch already exists"
+_PR_FETCH_TEMPLATE = "Failed to get pull request #{0}"
+_JIRA_FETCH_UNKNOWN_TEMPLATE = "Unknown error occurred while fetched Jira issue {0}"
+_JIRA_FETCH_SERVER_TEMPLATE = (
+    "Error occurred while fetched Jira issue {0}. Jira server response: {1}"
+)
+_JIRA_NOT_FOUND_TEMPLATE = (
+    "Failed to fetch Jira issue {0}: Issue does not exist or you do not have "
+    "permission to see it."
+)
+_CIRCUIT_OPEN_TEMPLATE = "Circuit breaker for '{0}' is open: recent calls kept failing"
+_PLAN_NOT_FOUND_TEMPLATE = "PLAN.md not found at {0}."
+_AGENT_QUERY_UNKNOWN_TEMPLATE = (
+    "Unknown error occurred while sending query to the agent. Error: {0}"
+)
+_AGENT_TIMEOUT_TEMPLATE = "Agent did not finish working on '{0}' within the {1}s time budget"
+
 
 class TicketToPRError(Exception):
     pass
@@ -11,7 +37,7 @@ class EnhancedGitError(TicketToPRError):
 
 class GitWorkspacePathNotExistsError(EnhancedGitError):
     def __init__(self, repo_path: Path) -> None:
-        super().__init__(f"Repository path does not exists locally - '{repo_path.resolve()}'")
+        super().__init__(_WORKSPACE_NOT_EXISTS_TEMPLATE.format(repo_path.resolve()))
 
 
 class GitFetchCheckoutError(EnhancedGitError):
@@ -20,14 +46,14 @@ class GitFetchCheckoutError(EnhancedGitError):
 
 class GitFetchCheckoutUnknownError(GitFetchCheckoutError):
     def __init__(self, error_msg: str) -> None:
-        super().__init__(f"Failed to fetch and checkout branch: {error_msg}")
+        super().__init__(_FETCH_CHECKOUT_UNKNOWN_TEMPLATE.format(error_msg))
 
 
 class LocalBranchAlreadyExistsError(GitFetchCheckoutError):
     def __init__(self, branch_name: str) -> None:
         super().__init__()
         self.branch_name = branch_name
-        self.args = (f"Local branch '{branch_name}' already exists",)
+        self.args = (_LOCAL_BRANCH_EXISTS_TEMPLATE.format(branch_name),)
 
 
 class GitPushError(EnhancedGitError):
@@ -37,7 +63,7 @@ class GitPushError(EnhancedGitError):
 
 class GitCloneError(EnhancedGitError):
     def __init__(self, clone_url: str, error_msg: str) -> None:
-        super().__init__(f"Failed to clone repository from '{clone_url}': {error_msg}")
+        super().__init__(_CLONE_FAILED_TEMPLATE.format(clone_url, error_msg))
 
 
 class InvalidGitRepositoryError(EnhancedGitError):
@@ -63,22 +89,17 @@ class FetchGithubBranchError(GithubClientError):
 
 class FetchGithubBranchUnknownError(FetchGithubBranchError):
     def __init__(self, branch_name: str):
-        super().__init__(f"Failed to find base branch '{branch_name}': unknown error")
+        super().__init__(_FETCH_BRANCH_UNKNOWN_TEMPLATE.format(branch_name))
 
 
 class GithubBranchNotFoundError(FetchGithubBranchError):
     def __init__(self, branch_name: str, repo_full_name: str):
-        super().__init__(
-            f"Failed to find base branch '{branch_name}' on repository: '{repo_full_name}'"
-        )
+        super().__init__(_BRANCH_NOT_FOUND_TEMPLATE.format(branch_name, repo_full_name))
 
 
 class FetchGithubBranchServerError(FetchGithubBranchError):
     def __init__(self, branch_name: str, github_server_response: str):
-        super().__init__(
-            f"Failed to find base branch '{branch_name}'. Github server response: "
-            f"{github_server_response}"
-        )
+        super().__init__(_FETCH_BRANCH_SERVER_TEMPLATE.format(branch_name, github_server_response))
 
 
 class GithubBranchCreationError(GithubClientError):
@@ -87,15 +108,21 @@ class GithubBranchCreationError(GithubClientError):
 
 class GithubBranchCreationServerError(GithubBranchCreationError):
     def __init__(self, branch_name: str, server_response: str):
-        message = f"Error while created branch '{branch_name}': unknown server error."
-        f"\n Server response: '{server_response}'"
+        # Single concatenated expression: the message used to be split
+        # across two f-strings, silently discarding the server response.
+        message = (
+            "Error while created branch '"
+            + branch_name
+            + "': unknown server error.\n Server response: '"
+            + server_response
+            + "'"
+        )
         super().__init__(message)
 
 
 class GithubBranchAlreadyExistsError(GithubBranchCreationError):
     def __init__(self, branch_name: str):
-        message = f"Error while creating branch '{branch_name}': branch already exists"
-        super().__init__(message)
+        super().__init__(_BRANCH_EXISTS_TEMPLATE.format(branch_name))
 
 
 class GithubPRCreationError(GithubClientError):
@@ -105,7 +132,7 @@ class GithubPRCreationError(GithubClientError):
 
 class GithubPRFetchError(GithubClientError):
     def __init__(self, pr_number: int):
-        super().__init__(f"Failed to get pull request #{pr_number}")
+        super().__init__(_PR_FETCH_TEMPLATE.format(pr_number))
 
 
 class JiraClientError(ClientError):
@@ -118,28 +145,27 @@ class JiraIssueFetchError(JiraClientError):
 
 class JiraIssueFetchUnknownError(JiraIssueFetchError):
     def __init__(self, issue_key: str):
-        super().__init__(f"Unknown error occurred while fetched Jira issue {issue_key}")
+        super().__init__(_JIRA_FETCH_UNKNOWN_TEMPLATE.format(issue_key))
 
 
 class JiraIssueFetchServerError(JiraIssueFetchError):
     def __init__(self, issue_key: str, jira_api_response: str):
-        super().__init__(
-            f"Error occurred while fetched Jira issue {issue_key}. Jira server response: "
-            f"{jira_api_response}"
-        )
+        super().__init__(_JIRA_FETCH_SERVER_TEMPLATE.format(issue_key, jira_api_response))
 
 
 class JiraIssueNotFoundError(JiraIssueFetchError):
     def __init__(self, issue_key: str):
-        super().__init__(
-            f"Failed to fetch Jira issue {issue_key}: Issue does not exist or you do not have "
-            "permission to see it."
-        )
+        super().__init__(_JIRA_NOT_FOUND_TEMPLATE.format(issue_key))
+
+
+class CircuitBreakerOpenError(ClientError):
+    def __init__(self, provider: str):
+        super().__init__(_CIRCUIT_OPEN_TEMPLATE.format(provider))
 
 
 class PlanNotFoundError(TicketToPRError):
     def __init__(self, plan_path: Path):
-        super().__init__(f"PLAN.md not found at {plan_path}.")
+        super().__init__(_PLAN_NOT_FOUND_TEMPLATE.format(plan_path))
 
 
 class PreCommitNotFoundError(TicketToPRError):
@@ -153,9 +179,12 @@ class AgentError(Exception):
 
 class AgentQueryUnknownError(AgentError):
     def __init__(self, error_msg: str) -> None:
-        super().__init__(
-            f"Unknown error occurred while sending query to the agent. Error: {error_msg}"
-        )
+        super().__init__(_AGENT_QUERY_UNKNOWN_TEMPLATE.format(error_msg))
+
+
+class AgentTimeoutError(AgentError):
+    def __init__(self, issue_key: str, timeout_s: float) -> None:
+        super().__init__(_AGENT_TIMEOUT_TEMPLATE.format(issue_key, timeout_s))
 
 
 class AgentLowCreditBalanceError(AgentError):
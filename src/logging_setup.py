@@ -1,7 +1,10 @@
 import abc
+import atexit
 import logging
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
 import colorlog
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -102,7 +105,8 @@ LOGGER_HANDLER_TO_CREATOR: dict[LoggerHandlerType, LoggerHandlerCreator] = {
 }
 
 
-def add_logger_handlers(logger: logging.Logger, params: SetupLoggerParams) -> None:
+def create_logger_handlers(params: SetupLoggerParams) -> list[logging.Handler]:
+    handlers = []
     for logger_handler_type in params.handler_types:
         if logger_handler_type not in LOGGER_HANDLER_TO_CREATOR:
             error_message = f"Unsupported logger handler type: {logger_handler_type}"
@@ -111,13 +115,39 @@ def add_logger_handlers(logger: logging.Logger, params: SetupLoggerParams) -> No
         if not isinstance(handler, logging.Handler):
             error_message = f"Expected logging.Handler, got {type(handler).__name__}"
             raise TypeError(error_message)
-        logger.addHandler(handler)
+        handlers.append(handler)
+    return handlers
+
+
+# The listener thread draining the log queue; one per process, replaced if
+# setup_logger runs again and stopped (flushing the queue) at interpreter exit.
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logger(params: SetupLoggerParams) -> None:
+    global _queue_listener
     root_logger = logging.getLogger()
     if root_logger.hasHandlers():
         root_logger.handlers.clear()
+    _stop_queue_listener()
 
     root_logger.setLevel(params.level)
-    add_logger_handlers(root_logger, params)
+    # Emitting a record is a blocking write per handler (TTY flush, file
+    # write); route records through a queue so the event loop only pays an
+    # enqueue and a background thread does the I/O.
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, *create_logger_handlers(params), respect_handler_level=True
+    )
+    _queue_listener.start()
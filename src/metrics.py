@@ -0,0 +1,54 @@
+import logging
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# (count, total_seconds) per stage name, aggregated for the process lifetime.
+# A plain dict instead of a Prometheus histogram: prometheus_client is not a
+# dependency, and the goal here is knowing which stage dominates latency, not
+# feeding a scrape endpoint.
+_stage_stats: dict[str, tuple[int, float]] = {}
+
+
+@contextmanager
+def stage(name: str) -> Generator[None]:
+    """
+    Time a workflow stage, aggregating per-stage totals and logging at DEBUG.
+
+    Wall-clock via perf_counter, so awaiting inside the block counts the full
+    span including time spent parked on the event loop - which is exactly the
+    latency a user experiences for that stage.
+
+    Args:
+        name: Stage label ("jira_fetch", "solve", "push", ...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        count, total = _stage_stats.get(name, (0, 0.0))
+        _stage_stats[name] = (count + 1, total + elapsed)
+        logger.debug("Stage '%s' took %.3fs", name, elapsed)
+
+
+def stage_stats() -> dict[str, tuple[int, float]]:
+    """Snapshot of (count, total_seconds) per stage recorded so far."""
+    return dict(_stage_stats)
+
+
+def reset_stage_stats() -> None:
+    """Clear recorded stage timings (for tests)."""
+    _stage_stats.clear()
+
+
+def log_stage_summary() -> None:
+    """Log one INFO line per stage, slowest total first."""
+    for name, (count, total) in sorted(
+        _stage_stats.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        logger.info(
+            "Stage '%s': %d run(s), %.3fs total, %.3fs avg", name, count, total, total / count
+        )
@@ -12,3 +12,19 @@ def generate_pr_title_from_jira_issue(jira_issue: JiraIssue) -> str:
         A string containing the PR title in format: [ISSUE-KEY] Summary
     """
     return f"[{jira_issue.key}] {jira_issue.summary}"
+
+
+def format_pr_titles(jira_issues: list[JiraIssue]) -> list[str]:
+    """
+    Generate PR titles for a batch of Jira issues in one pass.
+
+    Avoids per-issue function-call and attribute-dispatch overhead for
+    multi-ticket batch flows.
+
+    Args:
+        jira_issues: The JiraIssue objects to format
+
+    Returns:
+        A list of PR titles in format: [ISSUE-KEY] Summary
+    """
+    return [f"[{issue.key}] {issue.summary}" for issue in jira_issues]
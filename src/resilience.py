@@ -0,0 +1,234 @@
+import asyncio
+import functools
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any, TypeVar
+
+from src.exceptions import CircuitBreakerOpenError
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Backoff defaults: 0.5s doubling to a 30s cap covers the usual transient
+# window (connection resets, 5xx blips, rate-limit refills) without letting a
+# hard outage stretch a single call past a couple of minutes.
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_BASE_DELAY = 0.5
+_DEFAULT_CAP = 30.0
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker shared by every call site in the process.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    callers fail fast with CircuitBreakerOpenError instead of burning a full
+    retry schedule against a provider that is down. After `reset_timeout`
+    seconds one probe call is let through (half-open); its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    def allow(self) -> bool:
+        """Whether a call may proceed (closed, or open long enough to probe)."""
+        if self._opened_at is None:
+            return True
+        return time.monotonic() - self._opened_at >= self._reset_timeout
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self._failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    "Circuit breaker '%s' opened after %d consecutive failures",
+                    self.name,
+                    self._consecutive_failures,
+                )
+            self._opened_at = time.monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def breaker(provider: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a provider ("jira", "github", "llm")."""
+    found = _breakers.get(provider)
+    if found is None:
+        found = _breakers[provider] = CircuitBreaker(provider)
+    return found
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """
+    Extract a Retry-After hint from an exception chain, if any.
+
+    Rate-limited responses (429) usually say exactly how long to wait;
+    sleeping that amount beats re-deriving it with blind backoff. Both the
+    jira and github client exceptions carry the HTTP response, but our
+    wrappers chain them behind `__cause__`, so the whole chain is walked.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        response = getattr(current, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            headers = getattr(current, "headers", None)
+        if headers is not None:
+            try:
+                value = headers.get("Retry-After")
+            except AttributeError:
+                value = None
+            if value is not None:
+                try:
+                    return max(float(value), 0.0)
+                except (TypeError, ValueError):
+                    pass
+        current = current.__cause__
+    return None
+
+
+def _next_delay(attempt: int, base: float, cap: float, jitter: bool) -> float:
+    delay: float = min(base * (2 ** (attempt - 1)), cap)
+    if jitter:
+        # Full jitter (non-cryptographic randomness is fine here):
+        # desynchronizes concurrent workflows retrying against the same
+        # provider so they don't stampede it in lockstep.
+        delay = random.uniform(0, delay)
+    return delay
+
+
+def retry_sync(
+    provider: str,
+    *,
+    max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+    base: float = _DEFAULT_BASE_DELAY,
+    cap: float = _DEFAULT_CAP,
+    jitter: bool = True,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """
+    Retry a synchronous call with exponential backoff under a circuit breaker.
+
+    Intended for the blocking client methods that the workflow already runs
+    inside `asyncio.to_thread`, where `time.sleep` blocks only the worker
+    thread.
+
+    Args:
+        provider: Breaker key shared by all call sites for this provider
+        max_attempts: Total attempts including the first (default: 5)
+        base: First backoff delay in seconds (default: 0.5)
+        cap: Maximum backoff delay in seconds (default: 30)
+        jitter: Randomize each delay in [0, delay] (default: True)
+        retry_on: Exception types that trigger a retry; anything else
+            propagates immediately
+
+    Raises:
+        CircuitBreakerOpenError: If the provider's circuit is open.
+    """
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> _T:
+            circuit = breaker(provider)
+            attempt = 0
+            while True:
+                attempt += 1
+                if not circuit.allow():
+                    raise CircuitBreakerOpenError(provider)
+                try:
+                    result = func(*args, **kwargs)
+                except retry_on as e:
+                    circuit.record_failure()
+                    if attempt >= max_attempts:
+                        raise
+                    delay = _retry_after_seconds(e)
+                    if delay is None:
+                        delay = _next_delay(attempt, base, cap, jitter)
+                    logger.warning(
+                        "%s call failed (attempt %d/%d), retrying in %.1fs: %s",
+                        provider,
+                        attempt,
+                        max_attempts,
+                        delay,
+                        e,
+                    )
+                    time.sleep(delay)
+                else:
+                    circuit.record_success()
+                    return result
+
+        return wrapper
+
+    return decorator
+
+
+def retry_async(
+    provider: str,
+    *,
+    max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+    base: float = _DEFAULT_BASE_DELAY,
+    cap: float = _DEFAULT_CAP,
+    jitter: bool = True,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Coroutine[Any, Any, _T]]]:
+    """
+    Async counterpart of `retry_sync` for coroutine call sites.
+
+    Identical policy, but the backoff is an `asyncio.sleep` so sibling
+    workflows keep making progress on the event loop while one waits out a
+    transient failure.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[_T]],
+    ) -> Callable[..., Coroutine[Any, Any, _T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            circuit = breaker(provider)
+            attempt = 0
+            while True:
+                attempt += 1
+                if not circuit.allow():
+                    raise CircuitBreakerOpenError(provider)
+                try:
+                    result = await func(*args, **kwargs)
+                except retry_on as e:
+                    circuit.record_failure()
+                    if attempt >= max_attempts:
+                        raise
+                    delay = _retry_after_seconds(e)
+                    if delay is None:
+                        delay = _next_delay(attempt, base, cap, jitter)
+                    logger.warning(
+                        "%s call failed (attempt %d/%d), retrying in %.1fs: %s",
+                        provider,
+                        attempt,
+                        max_attempts,
+                        delay,
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    circuit.record_success()
+                    return result
+
+        return wrapper
+
+    return decorator
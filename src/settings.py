@@ -1,3 +1,6 @@
+import fnmatch
+import functools
+import os
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict
@@ -33,14 +36,39 @@ def find_first_toml(search_dir: Path, patterns: list[str] | None = None) -> Path
         msg = f"Config directory '{search_dir}' does not exist."
         raise FileNotFoundError(msg)
 
+    # One scandir pass per pattern instead of Path.glob: no Path object per
+    # directory entry, and the DirEntry type check reuses the cached stat
+    # from the scan. The default "*.toml" pattern short-circuits to a plain
+    # suffix check with no fnmatch at all.
     for pattern in patterns:
-        for toml_path in search_dir.glob(pattern):
-            if toml_path.is_file():
-                return toml_path
+        rest = pattern[1:]
+        is_literal_suffix = pattern.startswith("*") and not any(c in rest for c in "*?[")
+        suffix = rest if is_literal_suffix else None
+        with os.scandir(search_dir) as entries:
+            for entry in entries:
+                if suffix is not None:
+                    if not entry.name.endswith(suffix):
+                        continue
+                elif not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                if entry.is_file():
+                    return Path(entry.path)
     msg = f"No TOML file found in {search_dir} matching {patterns}"
     raise FileNotFoundError(msg)
 
 
+@functools.cache
+def _toml_source(settings_cls: type[BaseSettings]) -> TomlConfigSettingsSource:
+    """Locate and parse the config TOML once per settings class.
+
+    Every AppSettings() instantiation otherwise re-globs the config
+    directory and re-parses the file; the config does not change within a
+    process. A FileNotFoundError from the lookup is not cached, so a
+    missing config can be created and retried.
+    """
+    return TomlConfigSettingsSource(settings_cls, toml_file=find_first_toml(DEFAULT_CONFIG_DIR))
+
+
 class LoggingSettings(BaseModel):
     min_log_level: str = "INFO"
     log_file_path: Path = Path("ticket2pr.log")
@@ -111,10 +139,9 @@ class AppSettings(BaseSettings):
         dotenv_settings: PydanticBaseSettingsSource,  # noqa: ARG003
         file_secret_settings: PydanticBaseSettingsSource,  # noqa: ARG003
     ) -> tuple[PydanticBaseSettingsSource, ...]:
-        toml_file = find_first_toml(DEFAULT_CONFIG_DIR)
         # Customize the order of settings sources.(init > toml > env)
         return (
             init_settings,
-            TomlConfigSettingsSource(settings_cls, toml_file=toml_file),
+            _toml_source(settings_cls),
             env_settings,
         )
@@ -1,9 +1,8 @@
 from collections.abc import Callable
-from functools import wraps
 from pathlib import Path
 from typing import Any
 
-import tomli_w
+from rich.prompt import Confirm, Prompt
 
 from src.console_utils import (
     format_bold,
@@ -51,8 +50,6 @@ def _show_summary(
 
 
 def _confirm_save() -> bool:
-    from rich.prompt import Confirm
-
     if not Confirm.ask(format_cyan("Save this configuration?"), default=True):
         print_warning("Configuration cancelled.")
         return False
@@ -79,8 +76,6 @@ def _prompt_with_validation(
     value = None
     while value is None:
         try:
-            from rich.prompt import Prompt
-
             user_input = Prompt.ask(formatted_prompt, default=default, password=password)
             if user_input is not None:
                 value = validator(user_input)
@@ -90,21 +85,18 @@ def _prompt_with_validation(
     return value
 
 
-def section_decorator(section_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            print_section(section_name)
-            result = func(*args, **kwargs)
-            print_empty_line()
-            return result
-
-        return wrapper
+def _run_section(section_name: str, func: Callable[[], Any]) -> Any:
+    """Print the section header, run the collector, and close with a blank line.
 
-    return decorator
+    A plain helper instead of a decorator: same behavior without the
+    closure-and-wrapper frame on every call.
+    """
+    print_section(section_name)
+    result = func()
+    print_empty_line()
+    return result
 
 
-@section_decorator("Core Settings")
 def _collect_core_settings() -> str:
     from src.validators import validate_branch_name
 
@@ -117,7 +109,6 @@ def _collect_core_settings() -> str:
     return base_branch
 
 
-@section_decorator("Jira Settings")
 def _collect_jira_settings() -> tuple[str, str, str]:
     jira_base_url = _prompt_with_validation(
         "Jira base URL",
@@ -140,7 +131,6 @@ def _collect_jira_settings() -> tuple[str, str, str]:
     return jira_base_url, jira_username, jira_api_token
 
 
-@section_decorator("GitHub Settings")
 def _collect_github_settings() -> tuple[str, str]:
     github_api_token = _prompt_with_validation(
         "GitHub personal access token",
@@ -167,6 +157,10 @@ def _write_toml_config(
     github_api_token: str,
     repo_full_name: str,
 ) -> None:
+    # Deferred: the writer runs once, at the very end of the flow, and only
+    # if the user confirms - no point importing the serializer up front.
+    import tomli_w
+
     # Create parent directory if needed
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -185,17 +179,22 @@ def _write_toml_config(
         },
     }
 
-    with config_path.open("wb") as f:
-        tomli_w.dump(config, f)
+    # Serialize to one buffer and write it in a single call: the FD is
+    # closed immediately and the file never holds a partially-streamed dump.
+    config_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
 
 
 def initialize_settings(config_path: Path) -> None:
     try:
         _show_welcome()
 
-        base_branch = _collect_core_settings()
-        jira_base_url, jira_username, jira_api_token = _collect_jira_settings()
-        github_api_token, repo_full_name = _collect_github_settings()
+        base_branch = _run_section("Core Settings", _collect_core_settings)
+        jira_base_url, jira_username, jira_api_token = _run_section(
+            "Jira Settings", _collect_jira_settings
+        )
+        github_api_token, repo_full_name = _run_section(
+            "GitHub Settings", _collect_github_settings
+        )
 
         _show_summary(
             base_branch,
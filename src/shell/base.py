@@ -1,13 +1,17 @@
+import asyncio
 import subprocess  # nosec B404: subprocess is required to run pre-commit tools
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from pydantic import BaseModel
 
-
-class CommandResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CommandResult:
     return_code: int
     stdout: str
     stderr: str
+    # Memo slot for `output`; cached_property needs a __dict__, which
+    # slots=True deliberately drops, so the memo lives in its own slot.
+    _output: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def success(self) -> bool:
@@ -15,23 +19,78 @@ class CommandResult(BaseModel):
 
     @property
     def output(self) -> str:
-        return self.stdout + self.stderr
+        if self._output is None:
+            # frozen=True blocks plain assignment; bypass it for the memo only
+            object.__setattr__(self, "_output", self.stdout + self.stderr)
+        return self._output  # type: ignore[return-value]
+
 
+def run_command(args: list[str], cwd: Path | None = None, capture: bool = True) -> CommandResult:
+    """
+    Run a command and return its result.
 
-def run_command(args: list[str], cwd: Path | None = None) -> CommandResult:
+    Args:
+        args: Command and arguments to execute
+        cwd: Working directory for the command (default: inherit)
+        capture: When False, discard output to /dev/null — no pipe
+            allocation or decoding for callers that only check the
+            return code (default: True)
+    """
     expanded_path = None
     if cwd:
-        expanded_path = cwd.expanduser()
+        # Callers like run_pre_commit already pass expanded absolute paths;
+        # only a relative/"~" path needs another expansion pass.
+        expanded_path = cwd if cwd.is_absolute() else cwd.expanduser()
 
-    result = subprocess.run(
+    if not capture:
+        completed = subprocess.run(
+            args,  # nosec B603: executables are resolved via shutil.which and are trusted
+            cwd=expanded_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return CommandResult(return_code=completed.returncode, stdout="", stderr="")
+
+    # Popen + bytes pipes: communicate() collects raw output and each stream
+    # is decoded exactly once at the end, instead of text-mode's incremental
+    # decoding of every chunk as it arrives.
+    process = subprocess.Popen(
         args,  # nosec B603: pre_commit_executable is resolved via shutil.which and is trusted
         cwd=expanded_path,
-        capture_output=True,
-        text=True,
-        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = process.communicate()
+    return CommandResult(
+        return_code=process.returncode,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def run_command_async(args: list[str], cwd: Path | None = None) -> CommandResult:
+    """
+    Run a command without blocking the event loop.
+
+    Async counterpart of `run_command` for callers inside coroutines: the
+    subprocess runs via asyncio and both pipes are drained concurrently, so a
+    long-running command (e.g. pre-commit) doesn't stall other tasks such as a
+    streaming agent query.
+    """
+    expanded_path = None
+    if cwd:
+        expanded_path = cwd if cwd.is_absolute() else cwd.expanduser()
+
+    process = await asyncio.create_subprocess_exec(
+        *args,  # nosec B603: executables are resolved via shutil.which and are trusted
+        cwd=expanded_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
+    stdout, stderr = await process.communicate()
     return CommandResult(
-        return_code=result.returncode,
-        stdout=result.stdout,
-        stderr=result.stderr,
+        return_code=process.returncode if process.returncode is not None else -1,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
     )
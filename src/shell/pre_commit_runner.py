@@ -1,20 +1,38 @@
+import functools
+import os
 import shutil
+import sys
 from pathlib import Path
 
 from src.exceptions import PreCommitNotFoundError
-from src.shell.base import CommandResult, run_command
+from src.shell.base import CommandResult, run_command, run_command_async
 
 
+@functools.lru_cache(maxsize=1)
 def find_pre_commit_executable() -> str | None:
     """
     Find the pre-commit executable in PATH.
 
+    The result is cached for the process lifetime: each `shutil.which` call walks
+    every PATH entry with stat syscalls, and the resolved path never changes
+    within a run.
+
     Returns:
         Path to the pre-commit executable if found, None otherwise
     """
     return shutil.which("pre-commit")
 
 
+def reset_precommit_cache() -> None:
+    """
+    Forget the cached pre-commit executable path.
+
+    For tests (or long-lived processes) that change PATH and need the next
+    `find_pre_commit_executable` call to re-run the lookup.
+    """
+    find_pre_commit_executable.cache_clear()
+
+
 def is_pre_commit_installed() -> bool:
     """
     Check if pre-commit is installed and available in PATH.
@@ -25,23 +43,49 @@ def is_pre_commit_installed() -> bool:
     return find_pre_commit_executable() is not None
 
 
+@functools.lru_cache(maxsize=32)
 def has_pre_commit_config(workspace_path: Path) -> bool:
     """
     Check if .pre-commit-config.yaml exists and is a file in the workspace.
 
+    Cached per workspace: the config's presence does not change within a
+    run, and os.path avoids building intermediate Path objects on repeat
+    checks. Use `has_pre_commit_config.cache_clear()` in tests that create
+    the file mid-run.
+
     Returns:
         True if .pre-commit-config.yaml exists and is a file, False otherwise
     """
-    config_path = workspace_path.expanduser() / ".pre-commit-config.yaml"
-    return config_path.is_file()
+    return os.path.isfile(
+        os.path.join(os.path.expanduser(str(workspace_path)), ".pre-commit-config.yaml")
+    )
+
+
+def write_output_buffered(text: str) -> None:
+    """
+    Write captured pre-commit output to stdout in a single buffered write.
+
+    Hook logs can run to thousands of lines; printing them line-by-line costs
+    one `write` syscall (and any markup processing) per line. Encoding the
+    whole block once and handing it to `sys.stdout.buffer` collapses that to
+    a single write plus one flush.
+
+    Args:
+        text: The captured output to write verbatim
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(text.encode("utf-8", errors="replace"))
+    sys.stdout.buffer.flush()
 
 
-def run_pre_commit(workspace_path: Path) -> CommandResult:
+def run_pre_commit(workspace_path: Path, pre_commit_executable: str | None = None) -> CommandResult:
     """
     Run pre-commit hooks on staged files and return the result.
 
     Args:
         workspace_path: Path to the workspace root
+        pre_commit_executable: Pre-resolved executable path; looked up
+            (cached) when not provided
 
     Returns:
         PreCommitResult with success status and output
@@ -52,8 +96,39 @@ def run_pre_commit(workspace_path: Path) -> CommandResult:
     expanded_path = workspace_path.expanduser()
 
     # Resolving the full path to avoid Bandit B607 (start_process_with_partial_path)
-    pre_commit_executable = find_pre_commit_executable()
+    if pre_commit_executable is None:
+        pre_commit_executable = find_pre_commit_executable()
     if not pre_commit_executable:
         raise PreCommitNotFoundError
 
     return run_command([pre_commit_executable, "run"], expanded_path)
+
+
+async def run_pre_commit_async(
+    workspace_path: Path, pre_commit_executable: str | None = None
+) -> CommandResult:
+    """
+    Run pre-commit hooks on staged files without blocking the event loop.
+
+    Async counterpart of `run_pre_commit` for callers inside coroutines (the
+    workflow awaits this between agent fix attempts).
+
+    Args:
+        workspace_path: Path to the workspace root
+        pre_commit_executable: Pre-resolved executable path; looked up
+            (cached) when not provided
+
+    Returns:
+        CommandResult with success status and output
+
+    Raises:
+        PreCommitNotFoundError: If pre-commit executable is not found in PATH
+    """
+    expanded_path = workspace_path.expanduser()
+
+    if pre_commit_executable is None:
+        pre_commit_executable = find_pre_commit_executable()
+    if not pre_commit_executable:
+        raise PreCommitNotFoundError
+
+    return await run_command_async([pre_commit_executable, "run"], expanded_path)
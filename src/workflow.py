@@ -1,26 +1,41 @@
+import asyncio
+import contextlib
 import logging
+import os
+import tempfile
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 
-from src.agents.pr_generator import generate_commit_and_pr_body
-from src.agents.pre_commit_fixer import try_fix_pre_commit as try_fix_pre_commit_agent
-from src.agents.tests_agents import try_fix_tests
-from src.agents.ticket_solver import try_solve_ticket
 from src.branch_creator import create_branch_from_jira_issue
 from src.clients.github_client import GitHubClient
 from src.clients.jira_client import JiraClient
 from src.enhanced_git import EnhancedGit
+from src.metrics import stage
 from src.pr_content import generate_pr_title_from_jira_issue
 from src.shell.pre_commit_runner import (
+    find_pre_commit_executable,
     has_pre_commit_config,
     is_pre_commit_installed,
-    run_pre_commit,
+    run_pre_commit_async,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _first_line(text: str | None) -> str:
+    """First line of a possibly multi-line message, for log arguments.
+
+    A find+slice instead of split("\\n")[0], which would allocate a list of
+    every line of a long commit message just to log the first one.
+    """
+    if not text:
+        return "N/A"
+    newline_index = text.find("\n")
+    return text if newline_index == -1 else text[:newline_index]
+
+
 class WorkflowResult(BaseModel):
     branch_name: str
     pr_number: int
@@ -37,7 +52,13 @@ async def try_fix_pre_commit(
     Returns:
         True if pre-commit passes, False if it still fails after all retries.
     """
-    result = run_pre_commit(git.repo_path)
+    # Deferred: the fixer agent (and its SDK plumbing) is only needed once
+    # pre-commit actually fails.
+    from src.agents.pre_commit_fixer import try_fix_pre_commit as try_fix_pre_commit_agent
+
+    # Resolve the executable once for every run in the retry loop
+    pre_commit_executable = find_pre_commit_executable()
+    result = await run_pre_commit_async(git.repo_path, pre_commit_executable)
 
     if result.success:
         logger.info("pre-commit passed on first run")
@@ -50,13 +71,26 @@ async def try_fix_pre_commit(
             retries,
             git.repo_path,
         )
-        await try_fix_pre_commit_agent(
+        changes_made = await try_fix_pre_commit_agent(
             git.repo_path,
             pre_commit_output=result.output,
             mcp_config_path=mcp_config_path,
         )
+        if not changes_made:
+            # Nothing was touched, so re-running pre-commit would reproduce
+            # the same failure; further attempts would see the same input too.
+            logger.warning(
+                "Fix attempt %d/%d made no changes; skipping re-verification", attempt, retries
+            )
+            break
 
-        result = run_pre_commit(git.repo_path)
+        # Kick off verification as soon as the agent stream closes (staging is
+        # complete by then) so it overlaps with loop bookkeeping and log I/O.
+        verify_task = asyncio.create_task(
+            run_pre_commit_async(git.repo_path, pre_commit_executable)
+        )
+        logger.info("Verifying pre-commit after fix attempt %d/%d", attempt, retries)
+        result = await verify_task
         if result.success:
             logger.info("pre-commit passed after fix attempt %d", attempt)
             return True
@@ -79,64 +113,215 @@ async def workflow(
     mcp_config_path: Path | None = None,
     commit_no_verify: bool = False,
     fix_tests: bool = False,
+    isolated_worktree: bool = False,
 ) -> WorkflowResult:
+    # Deferred agent imports: importing src.workflow (e.g. for WorkflowResult
+    # or run_workflows' signature) should not pay for the agent modules'
+    # prompt tables and SDK plumbing; they load on the first actual run.
+    from src.agents.pr_generator import generate_commit_and_pr_body
+    from src.agents.ticket_solver import try_solve_ticket
+
     logger.info("Fetching Jira issue: %s", jira_issue_key)
-    issue = jira_client.fetch_issue(jira_issue_key)
+    # The Jira fetch is a network round trip and the pre-commit probe walks
+    # PATH; they are independent, so overlap them instead of serializing.
+    with stage("jira_fetch"):
+        issue, pre_commit_installed = await asyncio.gather(
+            asyncio.to_thread(jira_client.fetch_issue, jira_issue_key),
+            asyncio.to_thread(is_pre_commit_installed),
+        )
     logger.info("Creating branch for issue %s from base branch: %s", issue.key, base_branch)
-    branch_name = create_branch_from_jira_issue(
-        jira_issue=issue,
-        jira_client=jira_client,
-        github_client=github_client,
-        base_branch=base_branch,
-    )
-    logger.info("Fetching and checking out branch: %s", branch_name)
-    git.fetch_and_checkout_branch(branch_name)
-    logger.info("Solving ticket: %s (workspace: %s)", issue.key, git.repo_path)
-    session_id = await try_solve_ticket(
-        issue, workspace_path=git.repo_path, mcp_config_path=mcp_config_path
-    )
-    if fix_tests:
-        logger.info("Running and fixing tests from staged changes.")
-        await try_fix_tests(
-            workspace_path=git.repo_path,
-            mcp_config_path=mcp_config_path,
+    with stage("branch_create"):
+        branch_name = await create_branch_from_jira_issue(
+            jira_issue=issue,
+            jira_client=jira_client,
+            github_client=github_client,
+            base_branch=base_branch,
+        )
+    source_git = git
+    worktree_dir: Path | None = None
+    # Every background task is registered here so the finally block can
+    # cancel and drain whatever an error path left running.
+    background_tasks: list[asyncio.Task[Any]] = []
+    if isolated_worktree or os.environ.get("T2PR_ISOLATED_WORKTREE") == "1":
+        # Concurrent workflows otherwise mutate the same working tree; a
+        # linked worktree gives each ticket its own checkout while sharing
+        # the object store (a checkout's cost, not a clone's).
+        worktree_dir = Path(tempfile.mkdtemp(prefix=f"t2pr-{issue.key}-"))
+        logger.info("Creating isolated worktree for %s at %s", issue.key, worktree_dir)
+        git = await asyncio.to_thread(source_git.create_worktree, base_branch, worktree_dir)
+    try:
+        logger.info("Fetching and checking out branch: %s", branch_name)
+        # EnhancedGit stays synchronous (it has plain sync callers); inside
+        # the workflow its subprocess-backed calls run in worker threads so
+        # one ticket's git work never serializes the semaphore fan-out.
+        with stage("checkout"):
+            await asyncio.to_thread(git.fetch_and_checkout_branch, branch_name)
+        # PR-title generation depends only on the issue; start it now so it
+        # overlaps the long solver run and is ready when the PR is opened.
+        pr_title_task = asyncio.create_task(
+            asyncio.to_thread(generate_pr_title_from_jira_issue, issue)
         )
-    if commit_no_verify:
-        logger.info("Skipping pre-commit verification: --commit-no-verify flag is set")
-    elif not has_pre_commit_config(git.repo_path):
+        background_tasks.append(pr_title_task)
+        # Fetch remote refs while the solver runs: the work is independent of
+        # the solver's edits and leaves push-time pack negotiation starting
+        # from fresh refs.
+        prefetch_task = asyncio.create_task(git.background_prefetch())
+        background_tasks.append(prefetch_task)
+        logger.info("Solving ticket: %s (workspace: %s)", issue.key, git.repo_path)
+        with stage("solve"):
+            session_id = await try_solve_ticket(
+                issue, workspace_path=git.repo_path, mcp_config_path=mcp_config_path
+            )
+        if fix_tests:
+            from src.agents.tests_agents import try_fix_tests
+
+            logger.info("Running and fixing tests from staged changes.")
+            await try_fix_tests(
+                workspace_path=git.repo_path,
+                mcp_config_path=mcp_config_path,
+            )
+        # Snapshot the staged diff and start commit-message/PR-body generation
+        # now: it is an LLM call that normally serializes behind the pre-commit
+        # fix loop (another LLM call), yet only depends on the staged diff. If
+        # the fixes end up changing the diff, the message is regenerated below.
+        diff_before_fixes = await asyncio.to_thread(git.staged_diff)
+        logger.info("Generating commit message and PR body for branch: %s", branch_name)
+        message_task = asyncio.create_task(
+            generate_commit_and_pr_body(
+                session_id=session_id, workspace_path=git.repo_path, mcp_config_path=mcp_config_path
+            )
+        )
+        background_tasks.append(message_task)
+        if commit_no_verify:
+            logger.info("Skipping pre-commit verification: --commit-no-verify flag is set")
+        elif not has_pre_commit_config(git.repo_path):
+            logger.info(
+                "Skipping pre-commit verification: .pre-commit-config.yaml not found or not a file"
+            )
+        elif not pre_commit_installed:
+            logger.info("Skipping pre-commit verification: pre-commit is not installed")
+        else:
+            logger.info("pre-commit is installed. Trying to run it and fix any failures.")
+            with stage("pre_commit"):
+                await try_fix_pre_commit(git, mcp_config_path=mcp_config_path)
+        with stage("commit_msg"):
+            commit_message, pr_body = await message_task
+            if await asyncio.to_thread(git.staged_diff) != diff_before_fixes:
+                logger.info(
+                    "Staged changes shifted during pre-commit fixes; "
+                    "regenerating commit message and PR body"
+                )
+                commit_message, pr_body = await generate_commit_and_pr_body(
+                    session_id=session_id,
+                    workspace_path=git.repo_path,
+                    mcp_config_path=mcp_config_path,
+                )
+        if not await prefetch_task:
+            logger.debug("Background prefetch did not complete cleanly; push will self-fetch")
         logger.info(
-            "Skipping pre-commit verification: .pre-commit-config.yaml not found or not a file"
+            "Committing and pushing to branch: %s (commit message: %s)",
+            branch_name,
+            _first_line(commit_message),
         )
-    elif not is_pre_commit_installed():
-        logger.info("Skipping pre-commit verification: pre-commit is not installed")
-    else:
-        logger.info("pre-commit is installed. Trying to run it and fix any failures.")
-        await try_fix_pre_commit(git, mcp_config_path=mcp_config_path)
-    logger.info("Generating commit message and PR body for branch: %s", branch_name)
-    commit_message, pr_body = await generate_commit_and_pr_body(
-        session_id=session_id, workspace_path=git.repo_path, mcp_config_path=mcp_config_path
-    )
-    logger.info(
-        "Committing and pushing to branch: %s (commit message: %s)",
-        branch_name,
-        commit_message.split("\n")[0] if commit_message else "N/A",
-    )
-    git.commit_and_push(commit_message, no_verify=commit_no_verify)
-    logger.info("Generating PR title for issue: %s", issue.key)
-    pr_title = generate_pr_title_from_jira_issue(issue)
-    logger.info("Creating PR: title='%s', head=%s, base=%s", pr_title, branch_name, base_branch)
-    pr_number, pr_url = github_client.create_pull_request(
-        title=pr_title,
-        body=pr_body,
-        head_branch=branch_name,
-        base_branch=base_branch,
-    )
-    logger.info("PR created successfully: '%s' (branch: %s)", pr_title, branch_name)
-    return WorkflowResult(
-        branch_name=branch_name,
-        pr_number=pr_number,
-        pr_url=pr_url,
-        jira_issue_permalink=issue.permalink,
+        with stage("push"):
+            await asyncio.to_thread(git.commit_and_push, commit_message, no_verify=commit_no_verify)
+        logger.info("Generating PR title for issue: %s", issue.key)
+        pr_title = await pr_title_task
+        # Idempotency: a re-run of the same ticket (or a retry after a crash
+        # between push and PR creation) reuses the existing PR instead of
+        # failing on a duplicate create. The listing is cached per client, so
+        # a fan-out pays for it once.
+        with stage("pr_create"):
+            try:
+                open_prs = await asyncio.to_thread(github_client.list_open_prs_cached)
+            except Exception:
+                logger.warning("Could not list open PRs for idempotency check", exc_info=True)
+                open_prs = {}
+            existing_pr = open_prs.get(branch_name)
+            if existing_pr is not None:
+                pr_number, pr_url = existing_pr
+                logger.info("PR already exists for branch %s: %s", branch_name, pr_url)
+            else:
+                # Dispatch the PR creation to a worker thread immediately:
+                # PyGithub is blocking, and running it inline would stall
+                # sibling workflows on the event loop for the whole HTTPS
+                # round trip.
+                pr_task = asyncio.create_task(
+                    asyncio.to_thread(
+                        github_client.create_pull_request,
+                        title=pr_title,
+                        body=pr_body,
+                        head_branch=branch_name,
+                        base_branch=base_branch,
+                    )
+                )
+                background_tasks.append(pr_task)
+                logger.info(
+                    "Creating PR: title='%s', head=%s, base=%s", pr_title, branch_name, base_branch
+                )
+                pr_number, pr_url = await pr_task
+                logger.info("PR created successfully: '%s' (branch: %s)", pr_title, branch_name)
+        return WorkflowResult(
+            branch_name=branch_name,
+            pr_number=pr_number,
+            pr_url=pr_url,
+            jira_issue_permalink=issue.permalink,
+        )
+    finally:
+        # An error above abandons whichever background tasks are still in
+        # flight; cancel and drain them so their failures surface here
+        # instead of as "exception was never retrieved" noise at shutdown.
+        # On the success path every task is already done and this is a no-op.
+        for task in background_tasks:
+            task.cancel()
+        for task in background_tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        if worktree_dir is not None:
+            try:
+                await asyncio.to_thread(source_git.remove_worktree, worktree_dir)
+            except Exception:
+                logger.warning("Failed to remove worktree at %s", worktree_dir, exc_info=True)
+
+
+async def run_workflows(
+    issue_keys: list[str],
+    *,
+    max_concurrency: int = 4,
+    **workflow_kwargs: object,
+) -> list[WorkflowResult | BaseException]:
+    """
+    Run the workflow for several tickets with bounded concurrency.
+
+    Each workflow is overwhelmingly await-on-network (LLM, Jira, GitHub), so
+    fanning out under a semaphore overlaps that wait. Failures are returned
+    in place of results rather than cancelling sibling tickets.
+
+    With more than one ticket, per-ticket worktree isolation is forced:
+    concurrent checkouts/commits on a shared working tree would interleave
+    branches and commit one ticket's edits onto another's branch.
+
+    Args:
+        issue_keys: Jira issue keys to process
+        max_concurrency: Maximum workflows in flight at once (default: 4)
+        **workflow_kwargs: Remaining arguments forwarded to `workflow`
+
+    Returns:
+        Per-key results in input order; a failed ticket yields its exception.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    isolated_worktree = len(issue_keys) > 1
+
+    async def _guarded(issue_key: str) -> WorkflowResult:
+        async with semaphore:
+            return await workflow(
+                jira_issue_key=issue_key,
+                isolated_worktree=isolated_worktree,
+                **workflow_kwargs,  # type: ignore[arg-type]
+            )
+
+    return await asyncio.gather(
+        *(_guarded(issue_key) for issue_key in issue_keys), return_exceptions=True
     )
 
     # Get Pull request details from GitHub
@@ -0,0 +1,33 @@
+import pytest
+
+from src.branch_creator import generate_branch_name, sanitize_branch_name
+
+
+@pytest.mark.parametrize(
+    ("summary", "expected"),
+    [
+        ("Fix login bug", "fix-login-bug"),
+        ("Add OAuth2 support!!!", "add-oauth2-support"),
+        ("  spaces   everywhere  ", "spaces-everywhere"),
+        ("UPPER-case_and.dots", "upper-case-and-dots"),
+        ("émoji 🚀 summary", "moji-summary"),
+        ("---already-hyphenated---", "already-hyphenated"),
+        ("", ""),
+    ],
+)
+def test_sanitize_branch_name(summary: str, expected: str) -> None:
+    assert sanitize_branch_name(summary) == expected
+
+
+def test_sanitize_branch_name_max_length() -> None:
+    sanitized = sanitize_branch_name("a" * 50 + "-" + "b" * 60, max_length=51)
+    assert len(sanitized) <= 51
+    assert not sanitized.endswith("-")
+
+
+def test_generate_branch_name_is_deterministic_within_run() -> None:
+    # A retried creation must regenerate the same name, or the
+    # "branch already exists => reuse" path can never fire.
+    first = generate_branch_name("PROJ-1", "Fix login bug", "bug")
+    second = generate_branch_name("PROJ-1", "Fix login bug", "bug")
+    assert first == second
@@ -0,0 +1,45 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.enhanced_git import EnhancedGit
+
+
+def _git(repo_dir: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo_dir(tmp_path: Path) -> Path:
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    _git(repo_dir, "init", "-b", "main")
+    _git(repo_dir, "config", "user.email", "test@example.com")
+    _git(repo_dir, "config", "user.name", "Test")
+    (repo_dir / "README.md").write_text("hello\n")
+    _git(repo_dir, "add", "README.md")
+    _git(repo_dir, "commit", "-m", "initial commit")
+    return repo_dir
+
+
+def test_create_worktree_while_base_branch_is_checked_out(
+    repo_dir: Path, tmp_path: Path
+) -> None:
+    # "main" is checked out in the primary repository, and git refuses to
+    # check the same branch out twice — worktree creation must detach
+    # instead of failing, and two concurrent worktrees must coexist.
+    git = EnhancedGit(repo_dir)
+    first_dir = tmp_path / "wt1"
+    second_dir = tmp_path / "wt2"
+
+    first = git.create_worktree("main", first_dir)
+    second = git.create_worktree("main", second_dir)
+
+    assert first.repo.head.commit == git.repo.head.commit
+    assert second.repo.head.commit == git.repo.head.commit
+
+    git.remove_worktree(first_dir)
+    git.remove_worktree(second_dir)
+    assert not first_dir.exists()
+    assert not second_dir.exists()
@@ -0,0 +1,32 @@
+from collections.abc import Generator
+
+import pytest
+
+from src.metrics import reset_stage_stats, stage, stage_stats
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats() -> Generator[None]:
+    reset_stage_stats()
+    yield
+    reset_stage_stats()
+
+
+def test_stage_records_count_and_duration() -> None:
+    with stage("demo"):
+        pass
+    with stage("demo"):
+        pass
+
+    count, total = stage_stats()["demo"]
+    assert count == 2
+    assert total >= 0.0
+
+
+def test_stage_records_on_exception() -> None:
+    msg = "boom"
+    with pytest.raises(ValueError, match="boom"), stage("failing"):
+        raise ValueError(msg)
+
+    count, _ = stage_stats()["failing"]
+    assert count == 1
@@ -0,0 +1,38 @@
+from collections.abc import Generator
+
+import pytest
+
+from src.shell.pre_commit_runner import (
+    find_pre_commit_executable,
+    is_pre_commit_installed,
+    reset_precommit_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_executable_cache() -> Generator[None]:
+    reset_precommit_cache()
+    yield
+    reset_precommit_cache()
+
+
+def test_find_pre_commit_executable_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake_which(name: str) -> str:
+        calls.append(name)
+        return "/usr/bin/pre-commit"
+
+    monkeypatch.setattr("shutil.which", fake_which)
+    assert find_pre_commit_executable() == "/usr/bin/pre-commit"
+    assert find_pre_commit_executable() == "/usr/bin/pre-commit"
+    assert calls == ["pre-commit"]
+
+
+def test_cache_clear_allows_path_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("shutil.which", lambda _: None)
+    assert is_pre_commit_installed() is False
+
+    reset_precommit_cache()
+    monkeypatch.setattr("shutil.which", lambda _: "/usr/bin/pre-commit")
+    assert is_pre_commit_installed() is True
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from src.exceptions import CircuitBreakerOpenError
+from src.resilience import CircuitBreaker, breaker, retry_async
+
+
+def test_retry_async_retries_until_success() -> None:
+    attempts = 0
+
+    @retry_async("test-retry", max_attempts=3, base=0, jitter=False, retry_on=(ValueError,))
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            msg = "transient"
+            raise ValueError(msg)
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert attempts == 3
+
+
+def test_retry_async_does_not_retry_unlisted_exceptions() -> None:
+    attempts = 0
+
+    @retry_async("test-no-retry", max_attempts=3, base=0, retry_on=(ValueError,))
+    async def broken() -> None:
+        nonlocal attempts
+        attempts += 1
+        msg = "permanent"
+        raise KeyError(msg)
+
+    with pytest.raises(KeyError):
+        asyncio.run(broken())
+    assert attempts == 1
+
+
+def test_circuit_breaker_opens_and_fails_fast() -> None:
+    circuit = CircuitBreaker("test-breaker", failure_threshold=2, reset_timeout=3600)
+    assert circuit.allow()
+    circuit.record_failure()
+    assert circuit.allow()
+    circuit.record_failure()
+    assert not circuit.allow()
+    circuit.record_success()
+    assert circuit.allow()
+
+
+def test_open_circuit_short_circuits_calls() -> None:
+    circuit = breaker("test-short-circuit")
+    for _ in range(circuit._failure_threshold):
+        circuit.record_failure()
+
+    @retry_async("test-short-circuit", max_attempts=3, base=0)
+    async def never_runs() -> None:  # pragma: no cover
+        raise AssertionError
+
+    with pytest.raises(CircuitBreakerOpenError):
+        asyncio.run(never_runs())
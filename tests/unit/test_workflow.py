@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.clients.jira_client import JiraIssue
+from src.workflow import workflow
+
+_ISSUE = JiraIssue.model_construct(
+    key="PROJ-1",
+    summary="Fix the thing",
+    url="https://jira.example.com/browse/PROJ-1",
+    permalink="https://jira.example.com/browse/PROJ-1",
+)
+
+
+def test_workflow_creates_branch_once() -> None:
+    github_client = MagicMock()
+    github_client.list_open_prs_cached.return_value = {}
+    github_client.create_pull_request.return_value = (1, "https://github.com/o/r/pull/1")
+    jira_client = MagicMock()
+    jira_client.fetch_issue.return_value = _ISSUE
+    git = MagicMock()
+    git.repo_path = Path(".")
+    git.background_prefetch = AsyncMock(return_value=True)
+
+    create_branch = AsyncMock(return_value="proj-1-fix-the-thing")
+    with (
+        patch("src.workflow.create_branch_from_jira_issue", create_branch),
+        # The agent entry points are imported lazily inside workflow(), so
+        # they are patched at their source modules.
+        patch("src.agents.ticket_solver.try_solve_ticket", AsyncMock(return_value="session-id")),
+        patch(
+            "src.agents.pr_generator.generate_commit_and_pr_body",
+            AsyncMock(return_value=("commit msg", "pr body")),
+        ),
+        patch("src.workflow.generate_pr_title_from_jira_issue", return_value="PR title"),
+    ):
+        result = asyncio.run(
+            workflow(
+                github_client=github_client,
+                jira_client=jira_client,
+                jira_issue_key="PROJ-1",
+                git=git,
+                base_branch="main",
+                commit_no_verify=True,
+            )
+        )
+
+    assert create_branch.call_count == 1
+    assert jira_client.fetch_issue.call_count == 1
+    assert result.branch_name == "proj-1-fix-the-thing"
+    assert result.pr_number == 1